@@ -1,7 +1,8 @@
 # backend/format_json.py
-import json
 import os
 
+import orjson
+
 # Define the path to the JSON file
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 INPUT_JSON_PATH = os.path.join(BASE_DIR, "data", "english_dict.json")
@@ -16,19 +17,19 @@ def format_json_file(input_path: str, output_path: str) -> None:
     """
     try:
         # Read the JSON file
-        with open(input_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(input_path, "rb") as f:
+            data = orjson.loads(f.read())
 
         # Write the formatted JSON file
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, sort_keys=True)
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
 
         print(f"Successfully formatted JSON file. Saved to {output_path}")
         print(f"Number of entries: {len(data)}")
 
     except FileNotFoundError:
         print(f"Error: Input file not found at {input_path}")
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         print(f"Error: Failed to parse JSON file: {e}")
     except Exception as e:
         print(f"Error: An unexpected error occurred: {e}")
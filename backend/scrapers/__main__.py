@@ -0,0 +1,9 @@
+"""
+Run the Ojibwe scraper with ``python -m scrapers`` from the backend directory.
+
+Parse workers never import this entry point or the scraper module, only
+scrapers.parsers, so each worker starts with just the parsing libraries loaded.
+"""
+from scrapers.ojibwe_scraper import scrape_ojibwe
+
+scrape_ojibwe()
@@ -1,110 +1,221 @@
 """
 Scrape Ojibwe translations to build English-Ojibwe dictionaries.
 
-This module scrapes translations from online sources, stores raw data in JSON,
+This module scrapes translations from online sources, stores raw data as NDJSON,
 processes it into validated entries, performs optional semantic analysis,
 and syncs all data to Firestore with proper versioning.
+
+Run it from the backend directory with ``python -m scrapers``.
 """
 import asyncio
-import json
+import contextlib
+import functools
+import hashlib
+import heapq
+import multiprocessing
 import os
 import sqlite3
 import sys
 import time
-from typing import Dict, List, Set, Union
+from collections import Counter, defaultdict
+from email.utils import parsedate_to_datetime
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
+from urllib.parse import quote, quote_plus, urlsplit
 
 import aiohttp
+import orjson
 from asgiref.sync import sync_to_async
-from bs4 import BeautifulSoup
 from tqdm import tqdm
 
+# Optional on-disk HTTP cache; falls back to a plain session when not installed
+try:
+    from aiohttp_client_cache import CachedSession, SQLiteBackend
+    HTTP_CACHE_AVAILABLE = True
+except ImportError:
+    HTTP_CACHE_AVAILABLE = False
+
 # Add base directory to system path
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, BASE_DIR)
 
-# Configure Django settings
-os.environ.setdefault("DJANGO_SETTINGS_MODULE", "vota_backend.settings")
-import django
-
-django.setup()
+from scrapers.parsers import parse_glosbe, parse_ojibwe_lib_browse, parse_ojibwe_lib_search
 
-from translations.utils.logging_config import setup_logging
-
-setup_logging()
 import logging
 
 logger = logging.getLogger("translations.utils.ojibwe_scraper")
 
-from translations.models import (
-    create_english_to_ojibwe_local,
-    create_ojibwe_to_english_local,
-    create_semantic_match_local,
-    get_all_english_to_ojibwe,
-    get_all_ojibwe_to_english,
-    get_all_semantic_matches,
-    sync_english_dict_to_firestore,
-    sync_to_firestore,
-    get_firestore_version,
-    set_firestore_version,
-    create_missing_translation_local,
-)
-from translations.utils.frequencies import WORD_FREQUENCIES
-from translations.utils.get_dict_size import get_english_dict_size
-from translations.utils.process_raw_data import load_raw_data, save_raw_data, process_raw_data
+# Parse workers re-import a directly run script as __mp_main__; they only call into
+# scrapers.parsers, so Django, logging and the frequency tables are set up only here
+if __name__ != "__mp_main__":
+    # Configure Django settings
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "vota_backend.settings")
+    import django
+
+    django.setup()
+
+    from translations.utils.logging_config import setup_logging
+
+    setup_logging()
+
+    from translations.models import (
+        bulk_create_missing_translations_local,
+        bulk_create_translations_local,
+        get_all_english_to_ojibwe,
+        get_all_ojibwe_to_english,
+        get_all_semantic_matches,
+        sync_english_dict_to_firestore,
+        sync_to_firestore,
+        get_firestore_version,
+        set_firestore_version,
+    )
+    from translations.utils.frequencies import WORD_FREQUENCIES, get_top_words
+    from translations.utils.process_raw_data import (
+        adopt_legacy_raw_data,
+        append_raw_data,
+        load_raw_data,
+        process_raw_data,
+    )
 
 # Scraping configuration
 URLS = [
     "https://ojibwe.lib.umn.edu",
     "https://glosbe.com/en/oj",
 ]
+# Hosts searched word by word; ojibwe.lib is browsed by letter instead
+SEARCHED_HOSTS = tuple(urlsplit(url).hostname for url in URLS if "ojibwe.lib" not in url)
 TRANSLATION_THRESHOLD = 0.2  # 20% threshold
 SCRAPE_LIMIT = 1000
-OJIBWE_ALPHABET = {
+TRANSLATION_KEY_FIELDS = ["english_text", "ojibwe_text"]
+# Browse pages in a fixed order so letter results are merged deterministically
+OJIBWE_ALPHABET = (
     "a", "aa", "b", "d", "e", "g", "h", "i", "ii", "j", "k", "m", "n",
     "o", "oo", "p", "s", "t", "u", "w", "y", "z", "zh",
-}
+)
+# Fixed part of the ojibwe.lib search query; only the escaped word is appended per request
+OJIBWE_LIB_SEARCH_QUERY = "?utf8=%E2%9C%93&search_field=all_fields&q="
 HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
         "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
     ),
 }
-RAW_DATA_PATH = os.path.join(BASE_DIR, "data", "raw_ojibwe_english_dict.json")
+MAX_CONNECTIONS = 100
+MAX_CONNECTIONS_PER_HOST = 19
+KEEPALIVE_TIMEOUT = 30
+DNS_CACHE_TTL = 300  # Both hosts are resolved once per five minutes instead of every ten seconds
+REQUEST_TIMEOUT = 10
+RETRY_STATUSES = frozenset({429, 503})  # Overloaded or rate limited; worth waiting and retrying
+DEFAULT_HOST_CONCURRENCY = 10
+PARSE_WORKERS = os.cpu_count() or 1
+# Parse workers are started fresh rather than forked from a process holding Django,
+# the open sessions and the frequency tables; forkserver is used where the OS has it
+PARSE_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+HOST_CONCURRENCY = {
+    "ojibwe.lib.umn.edu": 5,  # Keep the university-hosted dictionary lightly loaded
+}
+# Raw data is newline-delimited JSON; older runs wrote it under a .json name
+RAW_DATA_PATH = os.path.join(BASE_DIR, "data", "raw_ojibwe_english_dict.ndjson")
+LEGACY_RAW_DATA_PATH = os.path.join(BASE_DIR, "data", "raw_ojibwe_english_dict.json")
 TIMESTAMP_PATH = os.path.join(BASE_DIR, "data", "timestamps.json")
+HTTP_CACHE_PATH = os.path.join(BASE_DIR, "data", "http_cache.sqlite")
+PAGE_DIGESTS_PATH = os.path.join(BASE_DIR, "data", "page_digests.bin")
+PAGE_DIGEST_SIZE = 16
+EMPTY_SEARCHES_PATH = os.path.join(BASE_DIR, "data", "empty_searches.json")
 ONE_MONTH_SECONDS = 30 * 24 * 60 * 60
+# Words every searched site had no entry for are not searched again for this long
+EMPTY_SEARCH_TTL = ONE_MONTH_SECONDS
 SEMANTIC_THRESHOLD = 0.7
 
 
 def load_timestamps() -> Dict[str, float]:
     """Load timestamps from JSON file."""
     try:
-        with open(TIMESTAMP_PATH, "r", encoding="utf-8") as file:
-            return json.load(file)
+        with open(TIMESTAMP_PATH, "rb") as file:
+            return orjson.loads(file.read())
     except FileNotFoundError:
         return {"last_scrape": 0, "last_sync": 0}
 
 
 def save_timestamps(timestamps: Dict[str, float]) -> None:
-    """Save timestamps to JSON file."""
-    with open(TIMESTAMP_PATH, "w", encoding="utf-8") as file:
-        json.dump(timestamps, file)
+    """Save timestamps to JSON file, replacing it atomically."""
+    tmp_path = f"{TIMESTAMP_PATH}.tmp"
+    with open(tmp_path, "wb") as file:
+        file.write(orjson.dumps(timestamps))
+    os.replace(tmp_path, TIMESTAMP_PATH)
     logger.info("Updated timestamps in timestamps.json")
 
 
-async def get_existing_translations_count() -> int:
-    """Count existing English-to-Ojibwe translations in Firestore."""
-    translations = await sync_to_async(get_all_english_to_ojibwe)()
+def load_page_digests() -> Set[bytes]:
+    """
+    Load digests of pages whose entries are already in the raw data file.
+
+    The digests only describe what the raw data file holds, so none are returned
+    when that file is missing.
+    """
+    if not os.path.exists(RAW_DATA_PATH):
+        return set()
+    try:
+        with open(PAGE_DIGESTS_PATH, "rb") as file:
+            data = file.read()
+    except FileNotFoundError:
+        return set()
+    return {
+        data[i:i + PAGE_DIGEST_SIZE]
+        for i in range(0, len(data) - PAGE_DIGEST_SIZE + 1, PAGE_DIGEST_SIZE)
+    }
+
+
+def save_page_digests(digests: Sequence[bytes]) -> None:
+    """Append digests of newly parsed pages to the digest file."""
+    with open(PAGE_DIGESTS_PATH, "ab") as file:
+        file.write(b"".join(digests))
+    logger.info(f"Recorded {len(digests)} parsed page digests.")
+
+
+def load_empty_searches() -> Dict[str, Dict[str, float]]:
+    """Load, per host, the words whose search recently found no entry and when."""
+    try:
+        with open(EMPTY_SEARCHES_PATH, "rb") as file:
+            return orjson.loads(file.read())
+    except FileNotFoundError:
+        return {}
+
+
+def save_empty_searches(empty_searches: Dict[str, Dict[str, float]]) -> None:
+    """Save the empty search record atomically, dropping entries older than EMPTY_SEARCH_TTL."""
+    cutoff = time.time() - EMPTY_SEARCH_TTL
+    current = {
+        host: {word: checked_at for word, checked_at in words.items() if checked_at > cutoff}
+        for host, words in empty_searches.items()
+    }
+    tmp_path = f"{EMPTY_SEARCHES_PATH}.tmp"
+    with open(tmp_path, "wb") as file:
+        file.write(orjson.dumps(current))
+    os.replace(tmp_path, EMPTY_SEARCHES_PATH)
+    logger.info(f"Recorded {sum(map(len, current.values()))} recent empty searches.")
+
+
+def get_existing_translations_count(translations: List[Dict]) -> int:
+    """Count existing English-to-Ojibwe translations already fetched from Firestore."""
     count = len(translations)
     logger.info(f"Found {count} existing English-to-Ojibwe translations in Firestore.")
     return count
 
 
-async def check_databases_populated() -> bool:
-    """Check if translation databases are populated."""
+async def check_databases_populated(english_to_ojibwe: List[Dict]) -> bool:
+    """
+    Check if translation databases are populated.
+
+    Takes the English-to-Ojibwe entries already fetched for this run; the
+    Ojibwe-to-English collection is only read when that list is empty.
+    """
     try:
-        english_to_ojibwe = await sync_to_async(get_all_english_to_ojibwe)()
-        ojibwe_to_english = await sync_to_async(get_all_ojibwe_to_english)()
-        populated = bool(english_to_ojibwe or ojibwe_to_english)
+        populated = bool(english_to_ojibwe) or bool(
+            await sync_to_async(get_all_ojibwe_to_english, thread_sensitive=False)()
+        )
         logger.info(f"Databases populated: {populated}")
         return populated
     except Exception as e:
@@ -112,189 +223,407 @@ async def check_databases_populated() -> bool:
         return False
 
 
-async def prompt_to_scrape() -> bool:
+async def prompt_to_scrape(english_to_ojibwe: List[Dict]) -> bool:
     """Prompt user to scrape if databases are populated."""
-    if await check_databases_populated():
+    if await check_databases_populated(english_to_ojibwe):
         print("\nDatabases are already populated with translation entries.")
         print("Do you want to proceed with scraping? (Y/n): ", end="")
-        response = input().strip().lower()
+        # Read input off the event loop so background tasks keep running meanwhile
+        response = (await asyncio.to_thread(input)).strip().lower()
         return response in ("", "y", "yes")
     logger.info("Databases are empty, proceeding with scraping.")
     return True
 
 
+_host_semaphores: Dict[str, asyncio.Semaphore] = {}
+# Monotonic time before which no new request is sent to a host that asked us to back off
+_host_resume_at: Dict[str, float] = {}
+# Request outcomes per host, summarized once by that host's scrape_full_dictionary pass
+_stats: Dict[str, Counter] = defaultdict(Counter)
+# Digests of pages already parsed into the raw data file, and those parsed this run
+_seen_page_digests: Set[bytes] = set()
+_new_page_digests: List[bytes] = []
+# Per host, words whose search found no entry, with the time it was checked
+_empty_searches: Dict[str, Dict[str, float]] = {}
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_host_semaphore(url: str) -> asyncio.Semaphore:
+    """Return the politeness semaphore for a URL's host, creating it on first use.
+
+    Each host gets its own pool of slots so ojibwe.lib and glosbe.com requests
+    never queue behind one another.
+    """
+    host = urlsplit(url).hostname or ""
+    if host not in _host_semaphores:
+        _host_semaphores[host] = asyncio.Semaphore(
+            HOST_CONCURRENCY.get(host, DEFAULT_HOST_CONCURRENCY)
+        )
+    return _host_semaphores[host]
+
+
+def parse_retry_after(value: Optional[str], attempt: int) -> float:
+    """Seconds to wait before retrying, from a Retry-After header or exponential backoff."""
+    if value:
+        if value.isdigit():
+            return float(value)
+        with contextlib.suppress(TypeError, ValueError):
+            retry_at = parsedate_to_datetime(value)
+            return max(0.0, retry_at.timestamp() - time.time())
+    return float(2**attempt)
+
+
+def page_digest(url: str, html: str) -> bytes:
+    """
+    Return the digest identifying a fetched page.
+
+    The URL is part of the digest because search results are attributed to the
+    searched word, so identical pages for different words are still parsed.
+    """
+    return hashlib.blake2b(f"{url}\n{html}".encode(), digest_size=PAGE_DIGEST_SIZE).digest()
+
+
+def is_unchanged_page(url: str, digest: bytes) -> bool:
+    """Return True if the page with this digest was already parsed into the raw data file."""
+    if digest in _seen_page_digests:
+        _stats[urlsplit(url).hostname or ""]["unchanged"] += 1
+        return True
+    return False
+
+
+def record_parsed_page(digest: bytes) -> None:
+    """Remember a page once it has been parsed, so a failed parse is retried next run."""
+    if digest not in _seen_page_digests:
+        _seen_page_digests.add(digest)
+        _new_page_digests.append(digest)
+
+
 async def fetch_url(
     session: aiohttp.ClientSession,
     url: str,
-    semaphore: asyncio.Semaphore,
     retries: int = 3,
 ) -> str:
-    """Fetch a URL with rate limiting and retries."""
-    async with semaphore:
+    """Fetch a URL with per-host rate limiting and retries."""
+    host = urlsplit(url).hostname or ""
+    stats = _stats[host]
+    async with get_host_semaphore(url):
         for attempt in range(retries):
+            # Honor a back-off the host asked for, even if another request received it
+            delay = _host_resume_at.get(host, 0.0) - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
             try:
-                async with session.get(url, headers=HEADERS, timeout=10) as response:
-                    if response.status == 429:
-                        retry_after = int(response.headers.get("Retry-After", 60))
-                        logger.warning(f"Rate limited on {url}. Waiting {retry_after}s.")
-                        await asyncio.sleep(retry_after)
+                async with session.get(url) as response:
+                    if response.status in RETRY_STATUSES:
+                        retry_after = parse_retry_after(response.headers.get("Retry-After"), attempt)
+                        logger.warning(
+                            f"Got {response.status} from {url}. Waiting {retry_after}s."
+                        )
+                        stats["retry"] += 1
+                        _host_resume_at[host] = max(
+                            _host_resume_at.get(host, 0.0), time.monotonic() + retry_after
+                        )
                         continue
                     response.raise_for_status()
                     return await response.text()
-            except aiohttp.ClientError as e:
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                 if attempt == retries - 1:
-                    logger.error(f"Failed to fetch {url} after {retries} attempts: {e}")
+                    stats["fail"] += 1
+                    logger.debug("Failed to fetch %s after %d attempts: %s", url, retries, e)
                     return ""
-                logger.warning(f"Attempt {attempt + 1}/{retries} failed for {url}: {e}")
+                stats["retry"] += 1
+                logger.debug("Attempt %d/%d failed for %s: %s", attempt + 1, retries, url, e)
                 await asyncio.sleep(2**attempt)
+        stats["fail"] += 1
         return ""
 
 
+def get_parse_pool() -> ProcessPoolExecutor:
+    """
+    Return the worker pool used to parse HTML off the event loop, creating it on first use.
+
+    Workers only need scrapers.parsers. Under ``python -m scrapers`` they never
+    import this module; when it is run as a script they re-import it as
+    __mp_main__, which skips the Django and logging setup.
+    """
+    global _parse_pool
+    if _parse_pool is None:
+        context = multiprocessing.get_context(PARSE_START_METHOD)
+        if PARSE_START_METHOD == "forkserver":
+            context.set_forkserver_preload(["scrapers.parsers"])
+        _parse_pool = ProcessPoolExecutor(max_workers=PARSE_WORKERS, mp_context=context)
+    return _parse_pool
+
+
+def shutdown_parse_pool() -> None:
+    """Stop the HTML parsing workers once a scrape has finished."""
+    global _parse_pool
+    if _parse_pool is not None:
+        _parse_pool.shutdown()
+        _parse_pool = None
+
+
+async def parse_html(parser: Callable, *args) -> List[Dict[str, Union[str, List[str]]]]:
+    """Run a parse function in the worker pool so parsing never blocks other fetches."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_parse_pool(), parser, *args)
+
+
+def build_ojibwe_lib_search_url(base_url: str, word: str) -> str:
+    """Build the ojibwe.lib search URL for word."""
+    return base_url + OJIBWE_LIB_SEARCH_QUERY + quote_plus(word)
+
+
+def build_glosbe_url(base_url: str, word: str) -> str:
+    """Build the Glosbe translation URL for word."""
+    return f"{base_url}/{quote(word, safe='')}"
+
+
+# URL builder and page parser for each searchable host
+SEARCH_SITES: Dict[str, Tuple[Callable, Callable]] = {
+    "ojibwe.lib.umn.edu": (build_ojibwe_lib_search_url, parse_ojibwe_lib_search),
+    "glosbe.com": (build_glosbe_url, parse_glosbe),
+}
+
+
 async def scrape_ojibwe_page(
     session: aiohttp.ClientSession,
     base_url: str,
     word: str,
-    semaphore: asyncio.Semaphore,
 ) -> List[Dict[str, Union[str, List[str]]]]:
     """Scrape a single page for Ojibwe translations."""
-    translations = []
-    url = (
-        f"{base_url}?utf8=%E2%9C%93&q={word}&search_field=all_fields"
-        if "ojibwe.lib" in base_url
-        else f"{base_url}/{word}"
-    )
+    host = urlsplit(base_url).hostname or ""
+    site = SEARCH_SITES.get(host)
+    if site is None:
+        return []
+    build_url, parser = site
 
-    html = await fetch_url(session, url, semaphore)
+    url = build_url(base_url, word)
+    html = await fetch_url(session, url)
     if not html:
-        return translations
+        return []
+    digest = page_digest(url, html)
+    if is_unchanged_page(url, digest):
+        return []
 
-    soup = BeautifulSoup(html, "html.parser")
-    ojibwe_text = None
-    english_text = word
+    translations = await parse_html(parser, html, word)
+    record_parsed_page(digest)
+    _stats[host]["success" if translations else "empty"] += 1
+    if translations:
+        _empty_searches.get(host, {}).pop(word, None)
+    else:
+        _empty_searches.setdefault(host, {})[word] = time.time()
+    return translations
 
-    if "ojibwe.lib" in base_url:
-        entry = soup.select_one(".search-results .main-entry-search")
-        if entry:
-            english_div = entry.select_one(".english-search-main-entry")
-            if english_div:
-                lemma_span = english_div.select_one(".main-entry-title .lemma")
-                ojibwe_text = lemma_span.text.strip() if lemma_span else None
-                definition_div = entry.select_one(".definition")
-                definition = (
-                    definition_div.get_text(separator=" ").strip()
-                    if definition_div
-                    else english_div.get_text(separator=" ").strip()
-                )
-                english_texts = [english_text]
-                if ojibwe_text:
-                    translations.append({
-                        "ojibwe_text": ojibwe_text,
-                        "english_text": english_texts,
-                        "definition": definition
-                    })
-    elif "glosbe.com" in base_url:
-        for item in soup.select("div.translation__item"):
-            ojibwe_span = item.find("span", attrs={"lang": "oj"})
-            if ojibwe_span and (ojibwe_text := ojibwe_span.text.strip()):
-                definition = item.get_text(separator=" ").strip()
-                translations.append({
-                    "ojibwe_text": ojibwe_text,
-                    "english_text": [english_text],
-                    "definition": definition
-                })
 
-    if translations:
-        logger.info(f"Scraped translation for '{word}' from {base_url}")
+def create_session() -> aiohttp.ClientSession:
+    """Create the HTTP session shared by every scrape pass.
+
+    A single session keeps its connection pool alive across both URL passes,
+    so repeat requests to the same host reuse open keep-alive connections
+    instead of paying a new TCP/TLS handshake. When aiohttp-client-cache is
+    installed, pages are also cached on disk for a month and revalidated with
+    the server's ETag/Last-Modified headers, so unchanged pages on monthly
+    re-scrapes are served locally instead of re-downloaded.
+    """
+    session_kwargs = dict(
+        headers=HEADERS,
+        connector=aiohttp.TCPConnector(
+            limit=MAX_CONNECTIONS,
+            limit_per_host=MAX_CONNECTIONS_PER_HOST,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=DNS_CACHE_TTL,
+        ),
+        timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+    )
+    if HTTP_CACHE_AVAILABLE:
+        cache = SQLiteBackend(
+            HTTP_CACHE_PATH,
+            expire_after=ONE_MONTH_SECONDS,
+            allowed_codes=(200,),
+            allowed_methods=("GET",),
+            cache_control=True,
+        )
+        return CachedSession(cache=cache, **session_kwargs)
+    logger.info("aiohttp-client-cache not installed; scraping without an HTTP cache.")
+    return aiohttp.ClientSession(**session_kwargs)
+
+
+async def scrape_letter(
+    session: aiohttp.ClientSession,
+    base_url: str,
+    letter: str,
+) -> List[Dict[str, Union[str, List[str]]]]:
+    """Scrape one ojibwe.lib browse page for the given alphabet letter."""
+    url = f"{base_url}/browse/ojibwe/{letter}"
+    html = await fetch_url(session, url)
+    if not html:
+        return []
+    digest = page_digest(url, html)
+    if is_unchanged_page(url, digest):
+        return []
+    host = urlsplit(base_url).hostname or ""
+    try:
+        translations = await parse_html(parse_ojibwe_lib_browse, html)
+    except Exception as e:
+        # One unreadable letter page must not abort the other letters' gather
+        _stats[host]["fail"] += 1
+        logger.debug("Error parsing %s: %s", url, e)
+        return []
+    record_parsed_page(digest)
+    _stats[host]["success" if translations else "empty"] += 1
     return translations
 
 
-async def scrape_full_dictionary(base_url: str) -> List[Dict[str, Union[str, List[str]]]]:
-    """Scrape translations from a single website."""
+async def scrape_full_dictionary(
+    base_url: str,
+    session: aiohttp.ClientSession,
+    english_words: Sequence[str],
+) -> List[Dict[str, Union[str, List[str]]]]:
+    """
+    Scrape translations from a single website using the shared session.
+
+    ojibwe.lib is browsed letter by letter; other sites are searched for each of
+    the first SCRAPE_LIMIT words in english_words.
+    """
     translations = []
-    semaphore = asyncio.Semaphore(10)
-    async with aiohttp.ClientSession() as session:
-        if "ojibwe.lib" in base_url:
-            for letter in OJIBWE_ALPHABET:
-                url = f"{base_url}/browse/ojibwe/{letter}"
-                html = await fetch_url(session, url, semaphore)
-                if not html:
-                    continue
-                soup = BeautifulSoup(html, "html.parser")
-                for entry in soup.select(".search-results .main-entry-search"):
-                    english_div = entry.select_one(".english-search-main-entry")
-                    if english_div:
-                        lemma_span = english_div.select_one(".main-entry-title .lemma")
-                        ojibwe_text = lemma_span.text.strip() if lemma_span else None
-                        if not ojibwe_text:
-                            continue
-                        definition = (
-                            entry.select_one(".definition").get_text(separator=" ").strip()
-                            if entry.select_one(".definition")
-                            else english_div.get_text(separator=" ").strip()
-                        )
-                        translations.append({
-                            "ojibwe_text": ojibwe_text,
-                            "english_text": [definition.split(",")[0].strip()],
-                            "definition": definition
-                        })
-                await asyncio.sleep(0.1)
-        else:
-            english_words = await get_english_words()
-            tasks = [
-                scrape_ojibwe_page(session, base_url, word, semaphore)
-                for word in english_words[:SCRAPE_LIMIT]
-            ]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            for result in results:
-                if isinstance(result, list):
-                    translations.extend(result)
+    host = urlsplit(base_url).hostname or ""
+    if "ojibwe.lib" in base_url:
+        # Letter pages are fetched concurrently; the host semaphore in fetch_url throttles them
+        tasks = [scrape_letter(session, base_url, letter) for letter in OJIBWE_ALPHABET]
+        for result in await asyncio.gather(*tasks):
+            translations.extend(result)
+    else:
+        # A fixed pool of workers pulls words from a shared iterator, so only a bounded
+        # number of coroutines exist at once and results are kept as each page finishes.
+        words = iter(english_words[:SCRAPE_LIMIT])
+        # Twice the host's request slots so a worker parsing a page never leaves a slot idle
+        worker_count = 2 * HOST_CONCURRENCY.get(host, DEFAULT_HOST_CONCURRENCY)
+
+        async def worker() -> None:
+            for word in words:
+                try:
+                    translations.extend(await scrape_ojibwe_page(session, base_url, word))
+                except Exception as e:
+                    _stats[host]["fail"] += 1
+                    logger.debug("Error scraping %s for %r: %s", base_url, word, e)
+
+        await asyncio.gather(*(worker() for _ in range(worker_count)))
+    stats = _stats.pop(host, Counter())
+    logger.info(
+        f"Scraped {base_url}: {len(translations)} translations "
+        f"(success={stats['success']} empty={stats['empty']} "
+        f"unchanged={stats['unchanged']} retry={stats['retry']} fail={stats['fail']})"
+    )
     return translations
 
 
-async def get_english_words() -> List[str]:
-    """Fetch English words from SQLite."""
+@functools.lru_cache(maxsize=1)
+def _fetch_english_words_sync() -> Tuple[str, ...]:
+    """Read all English words from SQLite on the calling thread, once per process."""
+    with contextlib.closing(sqlite3.connect("translations.db")) as conn:
+        conn.execute("PRAGMA query_only=1")
+        # Iterate the cursor directly so no intermediate list of row tuples is built
+        return tuple(word for (word,) in conn.execute("SELECT word FROM english_dict"))
+
+
+async def get_english_words() -> Tuple[str, ...]:
+    """Fetch English words from SQLite in a single worker-thread hop."""
     try:
-        conn = await sync_to_async(sqlite3.connect)("translations.db")
-        cursor = await sync_to_async(conn.cursor)()
-        await sync_to_async(cursor.execute)("SELECT word FROM english_dict")
-        words = [row[0] for row in await sync_to_async(cursor.fetchall)()]
-        await sync_to_async(conn.close)()
-        return words
+        return await sync_to_async(_fetch_english_words_sync, thread_sensitive=False)()
     except sqlite3.Error as e:
         logger.error(f"Error fetching English words: {e}")
-        return []
+        return ()
 
 
 def is_valid_translation(ojibwe_text: str, english_texts: List[str]) -> bool:
-    """Validate a translation."""
+    """
+    Validate a translation.
+
+    Expects lowercased text as produced by process_raw_data; a translation whose
+    Ojibwe text merely repeats one of its English texts is rejected.
+    """
     if not ojibwe_text or not english_texts:
         return False
-    if ojibwe_text.lower() in [e.lower() for e in english_texts]:
-        return False
-    return True
+    # english_texts holds a handful of glosses at most; scanning it beats building a set per call
+    return ojibwe_text not in english_texts
+
+
+def get_translation_keys(translations: List[Dict]) -> Set[Tuple[str, str]]:
+    """Build the (english_text, ojibwe_text) key set for stored translations."""
+    return {(t["english_text"], t["ojibwe_text"]) for t in translations}
+
 
+def check_duplicates(
+    new_translations: List[Dict], existing_keys: Set[Tuple[str, str]]
+) -> List[Dict]:
+    """
+    Remove duplicate translations.
 
-def check_duplicates(new_translations: List[Dict], existing_translations: List[Dict]) -> List[Dict]:
-    """Remove duplicate translations."""
-    existing_set = {(t["english_text"], t["ojibwe_text"]) for t in existing_translations}
+    Stored translations are lowercased on write and process_raw_data lowercases
+    new entries, so (english, ojibwe) keys can be compared directly against the
+    set from get_translation_keys.
+    """
     unique_new = [
         t for t in new_translations
-        if (t["english_text"][0], t["ojibwe_text"]) not in existing_set
+        if (t["english_text"][0], t["ojibwe_text"]) not in existing_keys
     ]
     logger.info(f"Filtered {len(new_translations) - len(unique_new)} duplicates, {len(unique_new)} new translations.")
     return unique_new
 
 
 def check_semantic_duplicates(new_matches: List[Dict], existing_matches: List[Dict]) -> List[Dict]:
-    """Remove duplicate semantic matches."""
+    """Remove duplicate semantic matches, comparing on the lowercased stored key."""
     existing_set = {(m["english_text"], m["ojibwe_text"]) for m in existing_matches}
     unique_new = [
         m for m in new_matches
-        if (m["english_text"], m["ojibwe_text"]) not in existing_set
+        if (m["english_text"].lower(), m["ojibwe_text"].lower()) not in existing_set
     ]
     return unique_new
 
 
+def recently_empty_words(
+    empty_searches: Dict[str, Dict[str, float]],
+    hosts: Sequence[str],
+    now: float,
+) -> Set[str]:
+    """
+    Return the words every one of hosts found no entry for within EMPTY_SEARCH_TTL.
+
+    A word missing from any one host's record may still have an entry there, so it
+    is kept for every site.
+    """
+    if not hosts:
+        return set()
+    cutoff = now - EMPTY_SEARCH_TTL
+    recent = [
+        {word for word, checked_at in empty_searches.get(host, {}).items() if checked_at > cutoff}
+        for host in hosts
+    ]
+    return set.intersection(*recent)
+
+
+def select_words_to_scrape(
+    english_words: Sequence[str],
+    translated_english: Set[str],
+    recently_empty: Set[str],
+) -> List[str]:
+    """
+    Pick the SCRAPE_LIMIT most frequent words worth searching for.
+
+    Case variants of the same word, words that already have a translation, words
+    no Ojibwe entry will match and words recently searched without a hit are
+    dropped first, so the search budget is only spent on words not tried lately.
+    """
+    candidates = (
+        word for word in dict.fromkeys(w.lower() for w in english_words)
+        if len(word) >= 2 and word.isascii()
+        and word not in translated_english and word not in recently_empty
+    )
+    # nlargest keeps only SCRAPE_LIMIT candidates instead of sorting the whole dictionary
+    return heapq.nlargest(SCRAPE_LIMIT, candidates, key=lambda w: WORD_FREQUENCIES.get(w, 0))
+
+
 async def scrape_ojibwe_async() -> List[Dict[str, Union[str, List[str]]]]:
     """
     Scrape translations, process data, and sync to Firestore with conditional versioning.
@@ -308,90 +637,123 @@ async def scrape_ojibwe_async() -> List[Dict[str, Union[str, List[str]]]]:
     """
     timestamps = load_timestamps()
     current_time = time.time()
-
-    # Load existing raw data as a starting point
-    raw_translations = load_raw_data(RAW_DATA_PATH)
-    if not raw_translations:
-        logger.info("No existing raw data found, initializing empty list.")
-        raw_translations = []
+    adopt_legacy_raw_data(LEGACY_RAW_DATA_PATH, RAW_DATA_PATH)
+
+    # Start independent reads now so they overlap the prompt and the scrape;
+    # each is awaited at its first point of use
+    english_words_task = asyncio.create_task(get_english_words())
+    # Only the key fields are needed here, so definitions are never downloaded
+    existing_translations_task = asyncio.create_task(
+        sync_to_async(get_all_english_to_ojibwe, thread_sensitive=False)(
+            fields=TRANSLATION_KEY_FIELDS
+        )
+    )
+    version_task = asyncio.create_task(
+        sync_to_async(get_firestore_version, thread_sensitive=False)()
+    )
+    semantic_matches_task = asyncio.create_task(
+        sync_to_async(get_all_semantic_matches, thread_sensitive=False)()
+    )
 
     # Determine if scraping should occur
-    should_scrape = await prompt_to_scrape()
+    # Fetched once and reused for the prompt, coverage check and duplicate filter
+    existing_translations = await existing_translations_task
+    should_scrape = await prompt_to_scrape(existing_translations)
     if should_scrape:
         # Check if scraping is needed based on time and coverage
-        dict_size = await sync_to_async(get_english_dict_size)()
-        translation_count = await get_existing_translations_count()
+        # The word list is already being read, so its length doubles as the dictionary size
+        english_words = await english_words_task
+        dict_size = len(english_words)
+        translation_count = get_existing_translations_count(existing_translations)
         coverage = translation_count / dict_size if dict_size > 0 else 0
         time_since_last_scrape = current_time - timestamps.get("last_scrape", 0)
 
         if time_since_last_scrape >= ONE_MONTH_SECONDS or coverage < TRANSLATION_THRESHOLD:
             logger.info("Performing scrape due to time elapsed or insufficient coverage.")
             new_translations = []
-            for url in URLS:
-                scraped = await scrape_full_dictionary(url)
-                new_translations.extend(scraped)
+            # Already translated and recently empty words are dropped before any request
+            translated_english = {t["english_text"] for t in existing_translations}
+            _empty_searches.update(load_empty_searches())
+            words_to_scrape = select_words_to_scrape(
+                english_words,
+                translated_english,
+                recently_empty_words(_empty_searches, SEARCHED_HOSTS, current_time),
+            )
+            # Pages whose entries are already in the raw data file are not parsed again
+            _seen_page_digests.update(load_page_digests())
+            try:
+                async with create_session() as session:
+                    # Each site has its own host semaphore, so both passes run side by side
+                    passes = [
+                        scrape_full_dictionary(url, session, words_to_scrape) for url in URLS
+                    ]
+                    for scraped in await asyncio.gather(*passes):
+                        new_translations.extend(scraped)
+            finally:
+                shutdown_parse_pool()
             if new_translations:
-                raw_translations.extend(new_translations)
-                save_raw_data(raw_translations, RAW_DATA_PATH)
+                # Only the new batch is written; the existing corpus is left in place
+                append_raw_data(new_translations, RAW_DATA_PATH)
                 timestamps["last_scrape"] = current_time
                 save_timestamps(timestamps)
                 logger.info(f"Scraped {len(new_translations)} new translations.")
             else:
                 logger.warning("No new translations scraped.")
+            # Recorded only once the pages' entries are safely in the raw data file
+            if _new_page_digests:
+                save_page_digests(_new_page_digests)
+                _new_page_digests.clear()
+            save_empty_searches(_empty_searches)
         else:
             logger.info("Skipping scrape: Recent scrape and sufficient coverage.")
     else:
         logger.info("User opted not to scrape. Proceeding with existing data.")
+    if not english_words_task.done():
+        english_words_task.cancel()
 
     # Process raw data into validated translations
-    validated_translations = process_raw_data(raw_translations)
+    validated_translations = process_raw_data(load_raw_data(RAW_DATA_PATH))
     if not validated_translations:
         logger.warning("No validated translations available after processing.")
+        version_task.cancel()
+        semantic_matches_task.cancel()
         return []
 
     # Sync english_dict to Firestore (optimized to skip if already present)
     await sync_to_async(sync_english_dict_to_firestore)()
     logger.info("Synced english_dict to Firestore (or skipped if already present).")
 
-    # Pull existing translations from Firestore
-    existing_translations = await sync_to_async(get_all_english_to_ojibwe)()
-    logger.info(f"Pulled {len(existing_translations)} existing translations.")
+    logger.info(f"Using {len(existing_translations)} existing translations.")
+    # Built once and shared by the duplicate filter and the missing-word diff
+    existing_keys = get_translation_keys(existing_translations)
 
     # Store new translations in SQLite
-    unique_new_translations = check_duplicates(validated_translations, existing_translations)
+    unique_new_translations = check_duplicates(validated_translations, existing_keys)
     cleaned_translations = [
         t for t in unique_new_translations
         if is_valid_translation(t["ojibwe_text"], t["english_text"])
     ]
-    current_version = await sync_to_async(get_firestore_version)()
-    for entry in cleaned_translations:
-        await sync_to_async(create_ojibwe_to_english_local)(
-            entry["ojibwe_text"], entry["english_text"], version=current_version
-        )
-        for e_text in entry["english_text"]:
-            await sync_to_async(create_english_to_ojibwe_local)(
-                e_text, entry["ojibwe_text"], entry["definition"], version=current_version
-            )
+    current_version = await version_task
+    await sync_to_async(bulk_create_translations_local)(
+        cleaned_translations, version=current_version
+    )
     logger.info(f"Stored {len(cleaned_translations)} translations in SQLite.")
 
     # Compute and store missing common translations
     top_n = 1000
-    sorted_words = sorted(WORD_FREQUENCIES.items(), key=lambda x: x[1], reverse=True)[:top_n]
-    common_words = {word.lower() for word, _ in sorted_words if len(word) >= 2}
-    translated_english = {t["english_text"].lower() for t in existing_translations}
-    missing_common_words = common_words - translated_english
-    missing_common_words = sorted(
-        missing_common_words, key=lambda x: WORD_FREQUENCIES.get(x, 0), reverse=True
+    translated_english = {english_text for english_text, _ in existing_keys}
+    # get_top_words is already ordered by frequency, so filtering keeps the order
+    missing_common_words = [
+        (word, frequency) for word, frequency in get_top_words(top_n)
+        if len(word) >= 2 and word not in translated_english
+    ]
+    await sync_to_async(bulk_create_missing_translations_local)(
+        missing_common_words, version=current_version
     )
-    for word in missing_common_words:
-        frequency = WORD_FREQUENCIES.get(word, 0)
-        await sync_to_async(create_missing_translation_local)(
-            english_text=word, frequency=frequency, version=current_version
-        )
     logger.info(f"Stored {len(missing_common_words)} missing translations.")
 
     # Check if semantic matches exist in Firestore
-    existing_semantic_matches = await sync_to_async(get_all_semantic_matches)()
+    existing_semantic_matches = await semantic_matches_task
     has_existing_semantic_matches = bool(existing_semantic_matches)
     logger.info(
         f"Firestore has {'some' if has_existing_semantic_matches else 'no'} existing semantic matches."
@@ -410,17 +772,8 @@ async def scrape_ojibwe_async() -> List[Dict[str, Union[str, List[str]]]]:
                 threshold=SEMANTIC_THRESHOLD, version=current_version
             )
             if matches:
+                # print_semantic_matches has already stored each batch as it was computed
                 semantic_matches.extend(matches)
-                for match in semantic_matches:
-                    await sync_to_async(create_semantic_match_local)(
-                        english_text=match["english_text"],
-                        ojibwe_text=match["ojibwe_text"],
-                        similarity=match["similarity"],
-                        english_definition=match["english_definition"],
-                        ojibwe_definition=match["ojibwe_definition"],
-                        version=current_version,
-                    )
-                logger.info(f"Stored {len(semantic_matches)} semantic matches.")
         except Exception as e:
             logger.error(f"Semantic analysis failed: {e}")
     else:
@@ -466,10 +819,13 @@ async def scrape_ojibwe_async() -> List[Dict[str, Union[str, List[str]]]]:
 
 def reset_processed_words() -> None:
     """Reset processed words file."""
-    processed_path = os.path.join(BASE_DIR, "data", "processed_words.json")
-    with open(processed_path, "w", encoding="utf-8") as f:
-        json.dump([], f)
-    logger.info("Reset processed_words.json")
+    processed_path = os.path.join(BASE_DIR, "data", "processed_words.txt")
+    # Truncating is enough; the file holds one processed word per line
+    open(processed_path, "w", encoding="utf-8").close()
+    # A list left under the old .json name would otherwise be adopted again on the next load
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(os.path.join(BASE_DIR, "data", "processed_words.json"))
+    logger.info("Reset processed_words.txt")
 
 
 def scrape_ojibwe() -> None:
@@ -0,0 +1,209 @@
+"""
+Page parsers for the Ojibwe scraper.
+
+Each parse function turns one fetched page into translation entries. They run in
+the scraper's worker processes, so this module only imports parsing libraries and
+never sets up Django, logging or the word frequency tables.
+"""
+from typing import Dict, List, Optional, Tuple, Union
+
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer
+
+# Prefer the C-backed lxml parser; fall back to the stdlib parser when it is not installed
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+    HTML_PARSER = "lxml"
+except ImportError:
+    lxml_html = None
+    HTML_PARSER = "html.parser"
+
+# CSS selectors compiled once instead of on every select()/select_one() call
+SEL_MAIN_ENTRY = sv.compile(".search-results .main-entry-search")
+SEL_ENGLISH_DIV = sv.compile(".english-search-main-entry")
+SEL_LEMMA = sv.compile(".main-entry-title .lemma")
+SEL_DEFINITION = sv.compile(".definition")
+SEL_GLOSBE_ITEM = sv.compile("div.translation__item")
+SEL_GLOSBE_OJIBWE = sv.compile('span[lang="oj"]')
+# Only the result containers are built into a tree; the rest of each page is skipped.
+# Strainers see the raw class attribute, so each one tests for a single class token.
+ONLY_OJIBWE_LIB_RESULTS = SoupStrainer(class_=lambda c: c and "search-results" in c.split())
+ONLY_GLOSBE_ITEMS = SoupStrainer("div", class_=lambda c: c and "translation__item" in c.split())
+# Pages are walked with compiled XPath straight on the lxml tree when available
+if lxml_html is not None:
+    XP_GLOSBE_ITEM = etree.XPath(
+        '//div[contains(concat(" ", normalize-space(@class), " "), " translation__item ")]'
+    )
+    XP_GLOSBE_OJIBWE = etree.XPath('.//span[@lang="oj"]')
+    XP_MAIN_ENTRY = etree.XPath(
+        '//*[contains(concat(" ", normalize-space(@class), " "), " search-results ")]'
+        '//*[contains(concat(" ", normalize-space(@class), " "), " main-entry-search ")]'
+    )
+    XP_ENGLISH_DIV = etree.XPath(
+        './/div[contains(concat(" ", normalize-space(@class), " "), " english-search-main-entry ")]'
+    )
+    XP_LEMMA = etree.XPath(
+        './/*[contains(concat(" ", normalize-space(@class), " "), " main-entry-title ")]'
+        '//*[contains(concat(" ", normalize-space(@class), " "), " lemma ")]'
+    )
+    XP_DEFINITION = etree.XPath(
+        './/*[contains(concat(" ", normalize-space(@class), " "), " definition ")]'
+    )
+# Browse pages are fed to the pull parser in slices so finished entries can be freed early
+BROWSE_FEED_CHUNK = 64 * 1024
+
+
+def _read_ojibwe_lib_entry(entry) -> Optional[Tuple[str, str]]:
+    """Return (ojibwe_text, definition) for an lxml .main-entry-search element with a lemma."""
+    english_divs = XP_ENGLISH_DIV(entry)
+    if not english_divs:
+        return None
+    lemma_spans = XP_LEMMA(english_divs[0])
+    ojibwe_text = "".join(lemma_spans[0].itertext()).strip() if lemma_spans else None
+    if not ojibwe_text:
+        return None
+    definition_divs = XP_DEFINITION(entry)
+    definition = " ".join((definition_divs[0] if definition_divs else english_divs[0]).itertext()).strip()
+    return ojibwe_text, definition
+
+
+def parse_ojibwe_lib_search(html: str, word: str) -> List[Dict[str, Union[str, List[str]]]]:
+    """Extract the top ojibwe.lib search result for word."""
+    translations = []
+    # lxml refuses an empty document, so a blank page simply has no entries
+    if not html.strip():
+        return translations
+    if lxml_html is not None:
+        entries = XP_MAIN_ENTRY(lxml_html.fromstring(html))
+        if entries and (entry := _read_ojibwe_lib_entry(entries[0])):
+            ojibwe_text, definition = entry
+            translations.append({
+                "ojibwe_text": ojibwe_text,
+                "english_text": [word],
+                "definition": definition
+            })
+        return translations
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=ONLY_OJIBWE_LIB_RESULTS)
+    entry = SEL_MAIN_ENTRY.select_one(soup)
+    if entry:
+        english_div = SEL_ENGLISH_DIV.select_one(entry)
+        if english_div:
+            lemma_span = SEL_LEMMA.select_one(english_div)
+            ojibwe_text = lemma_span.text.strip() if lemma_span else None
+            if ojibwe_text:
+                # The definition text is only walked for entries that are kept
+                definition_div = SEL_DEFINITION.select_one(entry)
+                definition = (
+                    definition_div.get_text(separator=" ").strip()
+                    if definition_div
+                    else english_div.get_text(separator=" ").strip()
+                )
+                translations.append({
+                    "ojibwe_text": ojibwe_text,
+                    "english_text": [word],
+                    "definition": definition
+                })
+    return translations
+
+
+def parse_glosbe(html: str, word: str) -> List[Dict[str, Union[str, List[str]]]]:
+    """Extract every Glosbe translation of word."""
+    translations = []
+    # lxml refuses an empty document, so a blank page simply has no entries
+    if not html.strip():
+        return translations
+    if lxml_html is not None:
+        for item in XP_GLOSBE_ITEM(lxml_html.fromstring(html)):
+            ojibwe_spans = XP_GLOSBE_OJIBWE(item)
+            if ojibwe_spans and (ojibwe_text := ojibwe_spans[0].text_content().strip()):
+                translations.append({
+                    "ojibwe_text": ojibwe_text,
+                    "english_text": [word],
+                    "definition": " ".join(item.itertext()).strip()
+                })
+        return translations
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=ONLY_GLOSBE_ITEMS)
+    for item in SEL_GLOSBE_ITEM.select(soup):
+        ojibwe_span = SEL_GLOSBE_OJIBWE.select_one(item)
+        if ojibwe_span and (ojibwe_text := ojibwe_span.text.strip()):
+            definition = item.get_text(separator=" ").strip()
+            translations.append({
+                "ojibwe_text": ojibwe_text,
+                "english_text": [word],
+                "definition": definition
+            })
+    return translations
+
+
+def _has_class(elem, name: str) -> bool:
+    """Return True if an lxml element carries the given class token."""
+    return name in (elem.get("class") or "").split()
+
+
+def parse_ojibwe_lib_browse(html: str) -> List[Dict[str, Union[str, List[str]]]]:
+    """
+    Extract every entry from an ojibwe.lib browse page.
+
+    With lxml the page is stream-parsed: each entry inside .search-results is
+    converted when its closing tag is seen, then cleared along with the entries
+    before it, so the tree never holds more than one entry's content. BeautifulSoup
+    is used when lxml is not installed.
+    """
+    translations = []
+    # lxml refuses an empty document, so a blank page simply has no entries
+    if not html.strip():
+        return translations
+    if lxml_html is not None:
+        parser = etree.HTMLPullParser(events=("start", "end"))
+        # Number of open .search-results elements around the current position
+        results_depth = 0
+
+        def drain() -> None:
+            nonlocal results_depth
+            for event, elem in parser.read_events():
+                if _has_class(elem, "search-results"):
+                    results_depth += 1 if event == "start" else -1
+                if event != "end" or not results_depth or not _has_class(elem, "main-entry-search"):
+                    continue
+                entry = _read_ojibwe_lib_entry(elem)
+                if entry:
+                    ojibwe_text, definition = entry
+                    translations.append({
+                        "ojibwe_text": ojibwe_text,
+                        # Only the first gloss is kept, so stop scanning at the first comma
+                        "english_text": [definition.partition(",")[0].strip()],
+                        "definition": definition
+                    })
+                elem.clear(keep_tail=True)
+                parent = elem.getparent()
+                while elem.getprevious() is not None:
+                    del parent[0]
+
+        for start in range(0, len(html), BROWSE_FEED_CHUNK):
+            parser.feed(html[start:start + BROWSE_FEED_CHUNK])
+            drain()
+        parser.close()
+        drain()
+        return translations
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=ONLY_OJIBWE_LIB_RESULTS)
+    for entry in SEL_MAIN_ENTRY.select(soup):
+        english_div = SEL_ENGLISH_DIV.select_one(entry)
+        if english_div:
+            lemma_span = SEL_LEMMA.select_one(english_div)
+            ojibwe_text = lemma_span.text.strip() if lemma_span else None
+            if not ojibwe_text:
+                continue
+            definition_div = SEL_DEFINITION.select_one(entry)
+            definition = (
+                definition_div.get_text(separator=" ").strip()
+                if definition_div
+                else english_div.get_text(separator=" ").strip()
+            )
+            translations.append({
+                "ojibwe_text": ojibwe_text,
+                # Only the first gloss is kept, so stop scanning at the first comma
+                "english_text": [definition.partition(",")[0].strip()],
+                "definition": definition
+            })
+    return translations
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.7 on 2026-10-15 22:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('translations', '0002_missingtranslationlocal_semanticmatchlocal'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='englishtoojibwelocal',
+            name='english_text',
+            field=models.TextField(db_index=True),
+        ),
+    ]
@@ -7,9 +7,9 @@ are pushed to Firestore with a consistent version, suitable for online deploymen
 import logging
 import os
 import re
-from typing import List
+from typing import Iterable, List, Optional, Set, Tuple
 
-from django.db import models
+from django.db import models, router, transaction
 from tqdm import tqdm
 
 # Attempt Firebase import with fallback for local development
@@ -19,7 +19,9 @@ try:
     FIREBASE_AVAILABLE = True
 except ImportError as e:
     FIREBASE_AVAILABLE = False
-    print(f"Firebase dependencies not available: {e}. Firestore operations will be skipped.")
+    logging.getLogger("translations.models").warning(
+        f"Firebase dependencies not available: {e}. Firestore operations will be skipped."
+    )
 
 from translations.utils.definition_utils import is_valid_definition, format_definition
 
@@ -30,6 +32,7 @@ cred_path = os.path.join(BASE_DIR, "firebase_credentials.json")
 
 # Global Firestore client
 db = None
+FIRESTORE_BATCH_LIMIT = 500  # Maximum number of writes Firestore accepts in one batch
 
 
 def initialize_firebase():
@@ -96,7 +99,7 @@ def sanitize_document_id(text: str) -> str:
 
 class EnglishToOjibweLocal(models.Model):
     """Local SQLite model for English-to-Ojibwe translations."""
-    english_text = models.TextField()
+    english_text = models.TextField(db_index=True)
     ojibwe_text = models.TextField()
     definition = models.TextField(blank=True, null=True)
     version = models.CharField(max_length=20, default="1.0")
@@ -224,20 +227,114 @@ def create_missing_translation_local(
         logger.error(f"Error creating missing translation in SQLite: {e}")
 
 
+# SQLite bulk creation functions (one transaction per call instead of one per row)
+
+BULK_BATCH_SIZE = 500
+
+
+def bulk_create_translations_local(entries: List[dict], version: str = "1.0") -> int:
+    """
+    Insert many scraped translations into SQLite in a single transaction.
+
+    Each entry needs "ojibwe_text", "english_text" (list) and "definition" keys and
+    produces one Ojibwe-to-English row plus one English-to-Ojibwe row per English
+    text, applying the same normalization as the single-row create functions.
+    An English-to-Ojibwe pair repeated across entries is stored once, with the
+    definition of its first entry. Returns the number of entries stored.
+    """
+    ojibwe_rows = []
+    english_rows = []
+    seen_pairs = set()
+    for entry in entries:
+        ojibwe_text = entry["ojibwe_text"].lower()
+        definition = entry.get("definition", "")
+        formatted_def = format_definition(definition) if definition else ""
+        ojibwe_rows.append(OjibweToEnglishLocal(
+            ojibwe_text=ojibwe_text,
+            english_text=[e.lower() for e in entry["english_text"]],
+            version=version,
+        ))
+        for english_text in entry["english_text"]:
+            if definition and not formatted_def:
+                logger.warning(f"Invalid definition for '{english_text}': {definition}")
+                continue
+            english_text = english_text.lower()
+            if (english_text, ojibwe_text) in seen_pairs:
+                continue
+            seen_pairs.add((english_text, ojibwe_text))
+            english_rows.append(EnglishToOjibweLocal(
+                english_text=english_text,
+                ojibwe_text=ojibwe_text,
+                definition=formatted_def,
+                version=version,
+            ))
+    try:
+        with transaction.atomic(using=router.db_for_write(OjibweToEnglishLocal)):
+            OjibweToEnglishLocal.objects.bulk_create(ojibwe_rows, batch_size=BULK_BATCH_SIZE)
+            EnglishToOjibweLocal.objects.bulk_create(english_rows, batch_size=BULK_BATCH_SIZE)
+        logger.info(
+            f"Bulk created {len(ojibwe_rows)} Ojibwe-to-English and "
+            f"{len(english_rows)} English-to-Ojibwe entries in SQLite."
+        )
+        return len(ojibwe_rows)
+    except Exception as e:
+        logger.error(f"Error bulk creating translations in SQLite: {e}")
+        return 0
+
+
+def bulk_create_missing_translations_local(
+    frequencies: List[tuple], version: str = "1.0"
+) -> int:
+    """Insert many (english_text, frequency) missing translations into SQLite at once."""
+    rows = [
+        MissingTranslationLocal(
+            english_text=english_text.lower(), frequency=frequency, version=version
+        )
+        for english_text, frequency in frequencies
+    ]
+    try:
+        MissingTranslationLocal.objects.bulk_create(rows, batch_size=BULK_BATCH_SIZE)
+        logger.info(f"Bulk created {len(rows)} missing translations in SQLite.")
+        return len(rows)
+    except Exception as e:
+        logger.error(f"Error bulk creating missing translations in SQLite: {e}")
+        return 0
+
+
+def bulk_create_semantic_matches_local(matches: List[dict], version: str = "1.0") -> int:
+    """Insert many semantic matches into SQLite at once."""
+    rows = [
+        SemanticMatchLocal(
+            english_text=match["english_text"].lower(),
+            ojibwe_text=match["ojibwe_text"].lower(),
+            similarity=match["similarity"],
+            english_definition=match.get("english_definition", ""),
+            ojibwe_definition=match.get("ojibwe_definition", ""),
+            version=version,
+        )
+        for match in matches
+    ]
+    try:
+        SemanticMatchLocal.objects.bulk_create(rows, batch_size=BULK_BATCH_SIZE)
+        logger.info(f"Bulk created {len(rows)} semantic matches in SQLite.")
+        return len(rows)
+    except Exception as e:
+        logger.error(f"Error bulk creating semantic matches in SQLite: {e}")
+        return 0
+
+
 # SQLite retrieval functions (fetch all entries, ignoring version)
 
-def get_all_english_to_ojibwe_local() -> List[dict]:
-    """Retrieve all English-to-Ojibwe translations from SQLite, regardless of version."""
+def get_all_english_to_ojibwe_local(fields: Optional[List[str]] = None) -> List[dict]:
+    """
+    Retrieve all English-to-Ojibwe translations from SQLite, regardless of version.
+
+    Only the given fields are selected when fields is set.
+    """
     try:
-        entries = EnglishToOjibweLocal.objects.all()
-        result = [
-            {
-                "english_text": e.english_text,
-                "ojibwe_text": e.ojibwe_text,
-                "definition": e.definition,
-            }
-            for e in entries
-        ]
+        result = list(EnglishToOjibweLocal.objects.values(
+            *(fields or ("english_text", "ojibwe_text", "definition"))
+        ))
         logger.info(f"Retrieved {len(result)} English-to-Ojibwe entries from SQLite.")
         return result
     except Exception as e:
@@ -245,14 +342,16 @@ def get_all_english_to_ojibwe_local() -> List[dict]:
         return []
 
 
-def get_all_ojibwe_to_english_local() -> List[dict]:
-    """Retrieve all Ojibwe-to-English translations from SQLite, regardless of version."""
+def get_all_ojibwe_to_english_local(fields: Optional[List[str]] = None) -> List[dict]:
+    """
+    Retrieve all Ojibwe-to-English translations from SQLite, regardless of version.
+
+    Only the given fields are selected when fields is set.
+    """
     try:
-        entries = OjibweToEnglishLocal.objects.all()
-        result = [
-            {"ojibwe_text": e.ojibwe_text, "english_text": e.english_text}
-            for e in entries
-        ]
+        result = list(OjibweToEnglishLocal.objects.values(
+            *(fields or ("ojibwe_text", "english_text"))
+        ))
         logger.info(f"Retrieved {len(result)} Ojibwe-to-English entries from SQLite.")
         return result
     except Exception as e:
@@ -260,6 +359,18 @@ def get_all_ojibwe_to_english_local() -> List[dict]:
         return []
 
 
+def get_translated_english_words_local() -> Set[str]:
+    """Retrieve the distinct English words that have a translation in SQLite."""
+    try:
+        words = EnglishToOjibweLocal.objects.values_list("english_text", flat=True).distinct()
+        result = {word.lower() for word in words}
+        logger.info(f"Retrieved {len(result)} translated English words from SQLite.")
+        return result
+    except Exception as e:
+        logger.error(f"Error retrieving translated English words from SQLite: {e}")
+        return set()
+
+
 def get_all_semantic_matches_local() -> List[dict]:
     """Retrieve all semantic matches from SQLite, regardless of version."""
     try:
@@ -325,6 +436,30 @@ def set_firestore_version(version: str) -> None:
         logger.error(f"Error setting Firestore version: {e}")
 
 
+def commit_in_batches(collection, documents: Iterable[Tuple[str, dict]]) -> int:
+    """
+    Write (document_id, data) pairs to a Firestore collection with batched commits.
+
+    Each batch holds up to FIRESTORE_BATCH_LIMIT writes, so a sync costs one round-trip
+    per batch instead of one per document. Returns the number of documents written.
+    """
+    client = get_firestore_client()
+    batch = client.batch()
+    pending = 0
+    total = 0
+    for doc_id, data in documents:
+        batch.set(collection.document(doc_id), data)
+        pending += 1
+        total += 1
+        if pending >= FIRESTORE_BATCH_LIMIT:
+            batch.commit()
+            batch = client.batch()
+            pending = 0
+    if pending:
+        batch.commit()
+    return total
+
+
 def check_english_dict_in_firestore() -> int:
     """
     Check the number of documents in the Firestore english_dict collection using metadata.
@@ -391,31 +526,14 @@ def sync_english_dict_to_firestore() -> None:
             f"({threshold}). Syncing {local_count} words to Firestore."
         )
 
-        # Use batched writes for efficiency (max 500 operations per batch)
-        batch = get_firestore_client().batch()
-        batch_count = 0
-        total_synced = 0
-
-        for word in tqdm(local_words, desc="Syncing English dictionary", unit="word"):
-            doc_id = sanitize_document_id(word.word)
-            doc_ref = get_collections()["english_dict"].document(doc_id)
-            batch.set(doc_ref, {"word": word.word.lower()})
-            batch_count += 1
-            total_synced += 1
-
-            if batch_count >= 500:
-                batch.commit()
-                logger.debug(f"Committed batch of {batch_count} English words.")
-                batch = get_firestore_client().batch()
-                batch_count = 0
-
-        # Commit any remaining operations
-        if batch_count > 0:
-            batch.commit()
-            logger.debug(f"Committed final batch of {batch_count} English words.")
+        english_dict = get_collections()["english_dict"]
+        total_synced = commit_in_batches(english_dict, (
+            (sanitize_document_id(word.word), {"word": word.word.lower()})
+            for word in tqdm(local_words, desc="Syncing English dictionary", unit="word")
+        ))
 
         # Update metadata with the new count
-        metadata_ref = get_collections()["english_dict"].document("_metadata")
+        metadata_ref = english_dict.document("_metadata")
         metadata_ref.set({"count": local_count})
         logger.info(f"Synced {total_synced} English words to Firestore and updated metadata.")
     except Exception as e:
@@ -437,52 +555,36 @@ def sync_to_firestore(version: str = "1.0") -> None:
         logger.error("Firestore unavailable. Cannot sync data.")
         raise RuntimeError("Firestore is unavailable. Cannot sync data.")
 
-    client = get_firestore_client()
+    collections = get_collections()
     try:
         # Sync English-to-Ojibwe
         entries = get_all_english_to_ojibwe_local()
         logger.info(f"Syncing {len(entries)} English-to-Ojibwe entries to Firestore.")
-        batch = client.batch()
-        batch_count = 0
-        for entry in tqdm(entries, desc="Syncing English-to-Ojibwe", unit="entry"):
-            if entry["definition"] and not is_valid_definition(entry["definition"]):
-                logger.warning(f"Skipping invalid definition for '{entry['english_text']}': {entry['definition']}")
-                continue
-            formatted_def = format_definition(entry["definition"]) if entry["definition"] else ""
-            doc_id = sanitize_document_id(entry["english_text"])
-            doc_ref = get_collections()["english_to_ojibwe"].document(doc_id)
-            batch.set(doc_ref, {
-                "english_text": entry["english_text"],
-                "ojibwe_text": entry["ojibwe_text"],
-                "definition": formatted_def,
-            })
-            batch_count += 1
-            if batch_count >= 500:
-                batch.commit()
-                batch = client.batch()
-                batch_count = 0
-        if batch_count > 0:
-            batch.commit()
+
+        def english_to_ojibwe_documents():
+            for entry in tqdm(entries, desc="Syncing English-to-Ojibwe", unit="entry"):
+                if entry["definition"] and not is_valid_definition(entry["definition"]):
+                    logger.warning(f"Skipping invalid definition for '{entry['english_text']}': {entry['definition']}")
+                    continue
+                formatted_def = format_definition(entry["definition"]) if entry["definition"] else ""
+                yield sanitize_document_id(entry["english_text"]), {
+                    "english_text": entry["english_text"],
+                    "ojibwe_text": entry["ojibwe_text"],
+                    "definition": formatted_def,
+                }
+
+        commit_in_batches(collections["english_to_ojibwe"], english_to_ojibwe_documents())
 
         # Sync Ojibwe-to-English
         entries = get_all_ojibwe_to_english_local()
         logger.info(f"Syncing {len(entries)} Ojibwe-to-English entries to Firestore.")
-        batch = client.batch()
-        batch_count = 0
-        for entry in tqdm(entries, desc="Syncing Ojibwe-to-English", unit="entry"):
-            doc_id = sanitize_document_id(entry["ojibwe_text"])
-            doc_ref = get_collections()["ojibwe_to_english"].document(doc_id)
-            batch.set(doc_ref, {
+        commit_in_batches(collections["ojibwe_to_english"], (
+            (sanitize_document_id(entry["ojibwe_text"]), {
                 "ojibwe_text": entry["ojibwe_text"],
                 "english_text": entry["english_text"],
             })
-            batch_count += 1
-            if batch_count >= 500:
-                batch.commit()
-                batch = client.batch()
-                batch_count = 0
-        if batch_count > 0:
-            batch.commit()
+            for entry in tqdm(entries, desc="Syncing Ojibwe-to-English", unit="entry")
+        ))
 
         # Sync semantic matches
         entries = get_all_semantic_matches_local()
@@ -490,45 +592,27 @@ def sync_to_firestore(version: str = "1.0") -> None:
             logger.warning("No semantic matches found in SQLite. Ensure semantic analysis has been run.")
         else:
             logger.info(f"Syncing {len(entries)} semantic matches to Firestore.")
-            batch = client.batch()
-            batch_count = 0
-            for entry in tqdm(entries, desc="Syncing semantic matches", unit="match"):
-                doc_id = sanitize_document_id(f"{entry['english_text']}_{entry['ojibwe_text']}")
-                doc_ref = get_collections()["semantic_matches"].document(doc_id)
-                batch.set(doc_ref, {
+            commit_in_batches(collections["semantic_matches"], (
+                (sanitize_document_id(f"{entry['english_text']}_{entry['ojibwe_text']}"), {
                     "english_text": entry["english_text"],
                     "ojibwe_text": entry["ojibwe_text"],
                     "similarity": entry["similarity"],
                     "english_definition": entry["english_definition"] or "",
                     "ojibwe_definition": entry["ojibwe_definition"] or "",
                 })
-                batch_count += 1
-                if batch_count >= 500:
-                    batch.commit()
-                    batch = client.batch()
-                    batch_count = 0
-            if batch_count > 0:
-                batch.commit()
+                for entry in tqdm(entries, desc="Syncing semantic matches", unit="match")
+            ))
 
         # Sync missing translations
         entries = get_all_missing_translations_local()
         logger.info(f"Syncing {len(entries)} missing translations to Firestore.")
-        batch = client.batch()
-        batch_count = 0
-        for entry in tqdm(entries, desc="Syncing missing translations", unit="entry"):
-            doc_id = sanitize_document_id(entry["english_text"])
-            doc_ref = get_collections()["missing_translations"].document(doc_id)
-            batch.set(doc_ref, {
+        commit_in_batches(collections["missing_translations"], (
+            (sanitize_document_id(entry["english_text"]), {
                 "english_text": entry["english_text"],
                 "frequency": entry["frequency"],
             })
-            batch_count += 1
-            if batch_count >= 500:
-                batch.commit()
-                batch = client.batch()
-                batch_count = 0
-        if batch_count > 0:
-            batch.commit()
+            for entry in tqdm(entries, desc="Syncing missing translations", unit="entry")
+        ))
 
         # Set the specified version in Firestore
         set_firestore_version(version)
@@ -585,18 +669,13 @@ def update_or_create_english_to_ojibwe(
             logger.warning(f"Invalid definition for '{english_text}': {definition}")
             return
         doc_id = sanitize_document_id(english_text)
-        doc_ref = get_collections()["english_to_ojibwe"].document(doc_id)
-        doc = doc_ref.get()
-        if doc.exists:
-            doc_ref.update({"ojibwe_text": ojibwe_text.lower(), "definition": formatted_def})
-            logger.info(f"Updated English-to-Ojibwe in Firestore: {english_text}")
-        else:
-            doc_ref.set({
-                "english_text": english_text.lower(),
-                "ojibwe_text": ojibwe_text.lower(),
-                "definition": formatted_def,
-            })
-            logger.info(f"Created English-to-Ojibwe in Firestore: {english_text}")
+        # A merged set creates or updates in one write, without reading the document first
+        get_collections()["english_to_ojibwe"].document(doc_id).set({
+            "english_text": english_text.lower(),
+            "ojibwe_text": ojibwe_text.lower(),
+            "definition": formatted_def,
+        }, merge=True)
+        logger.info(f"Upserted English-to-Ojibwe in Firestore: {english_text}")
     except Exception as e:
         logger.error(f"Error updating/creating English-to-Ojibwe in Firestore: {e}")
 
@@ -608,48 +687,78 @@ def update_or_create_ojibwe_to_english(ojibwe_text: str, english_text: list) ->
         return
     try:
         doc_id = sanitize_document_id(ojibwe_text)
-        doc_ref = get_collections()["ojibwe_to_english"].document(doc_id)
-        doc = doc_ref.get()
         english_texts = [e.lower() for e in ([english_text] if isinstance(english_text, str) else english_text)]
-        if doc.exists:
-            current_english = doc.to_dict().get("english_text", [])
-            updated_english = list(set(current_english + english_texts))
-            doc_ref.update({"english_text": updated_english})
-            logger.info(f"Updated Ojibwe-to-English in Firestore: {ojibwe_text}")
-        else:
-            create_ojibwe_to_english(ojibwe_text, english_texts)
+        # ArrayUnion adds all English texts server-side in one write, skipping ones already stored
+        get_collections()["ojibwe_to_english"].document(doc_id).set({
+            "ojibwe_text": ojibwe_text.lower(),
+            "english_text": firestore.ArrayUnion(english_texts),
+        }, merge=True)
+        logger.info(f"Upserted Ojibwe-to-English in Firestore: {ojibwe_text}")
     except Exception as e:
         logger.error(f"Error updating/creating Ojibwe-to-English in Firestore: {e}")
 
 
 # Firestore retrieval functions with SQLite fallback
 
-def get_all_english_to_ojibwe() -> List[dict]:
-    """Retrieve all English-to-Ojibwe translations from Firestore, falling back to SQLite."""
+def get_all_english_to_ojibwe(fields: Optional[List[str]] = None) -> List[dict]:
+    """
+    Retrieve all English-to-Ojibwe translations from Firestore, falling back to SQLite.
+
+    When fields is set, only those fields are fetched (a Firestore projection query).
+    """
     if FIREBASE_AVAILABLE:
         try:
-            docs = get_collections()["english_to_ojibwe"].stream()
+            collection = get_collections()["english_to_ojibwe"]
+            docs = (collection.select(fields) if fields else collection).stream()
             result = [doc.to_dict() for doc in docs]
             logger.info(f"Retrieved {len(result)} English-to-Ojibwe from Firestore.")
             return result
         except Exception as e:
             logger.error(f"Error retrieving English-to-Ojibwe from Firestore: {e}")
     logger.warning("Falling back to SQLite for English-to-Ojibwe translations.")
-    return get_all_english_to_ojibwe_local()
+    return get_all_english_to_ojibwe_local(fields)
+
 
+def get_all_ojibwe_to_english(fields: Optional[List[str]] = None) -> List[dict]:
+    """
+    Retrieve all Ojibwe-to-English translations from Firestore, falling back to SQLite.
 
-def get_all_ojibwe_to_english() -> List[dict]:
-    """Retrieve all Ojibwe-to-English translations from Firestore, falling back to SQLite."""
+    When fields is set, only those fields are fetched (a Firestore projection query).
+    """
     if FIREBASE_AVAILABLE:
         try:
-            docs = get_collections()["ojibwe_to_english"].stream()
+            collection = get_collections()["ojibwe_to_english"]
+            docs = (collection.select(fields) if fields else collection).stream()
             result = [doc.to_dict() for doc in docs]
             logger.info(f"Retrieved {len(result)} Ojibwe-to-English from Firestore.")
             return result
         except Exception as e:
             logger.error(f"Error retrieving Ojibwe-to-English from Firestore: {e}")
     logger.warning("Falling back to SQLite for Ojibwe-to-English translations.")
-    return get_all_ojibwe_to_english_local()
+    return get_all_ojibwe_to_english_local(fields)
+
+
+def get_translated_english_words() -> Set[str]:
+    """
+    Retrieve the English words that have a translation, lowercased.
+
+    Only the english_text field is fetched from Firestore; the SQLite fallback
+    deduplicates in the query itself.
+    """
+    if FIREBASE_AVAILABLE:
+        try:
+            docs = get_collections()["english_to_ojibwe"].select(["english_text"]).stream()
+            result = {
+                english_text.lower()
+                for doc in docs
+                if (english_text := doc.to_dict().get("english_text"))
+            }
+            logger.info(f"Retrieved {len(result)} translated English words from Firestore.")
+            return result
+        except Exception as e:
+            logger.error(f"Error retrieving translated English words from Firestore: {e}")
+    logger.warning("Falling back to SQLite for translated English words.")
+    return get_translated_english_words_local()
 
 
 def get_all_semantic_matches() -> List[dict]:
@@ -1,13 +1,29 @@
 """Unit tests for the translations backend functionality."""
-from django.test import TestCase
-from unittest.mock import patch
+import asyncio
+import json
+import os
+import tempfile
+import time
+from django.test import SimpleTestCase, TestCase
+from unittest import skipIf
+from unittest.mock import AsyncMock, patch
+from scrapers import ojibwe_scraper, parsers
 from translations.models import (
     update_or_create_english_to_ojibwe,
     update_or_create_ojibwe_to_english,
     get_all_english_to_ojibwe,
+    bulk_create_translations_local,
+    EnglishToOjibweLocal,
     EnglishWord,
+    OjibweToEnglishLocal,
 )
 from translations.utils.dict_converter import populate_english_dict, clear_english_dict
+from translations.utils.process_raw_data import (
+    adopt_legacy_raw_data,
+    append_raw_data,
+    load_raw_data,
+    process_raw_data,
+)
 
 
 class TranslationTests(TestCase):
@@ -57,4 +73,318 @@ class TranslationTests(TestCase):
         update_or_create_english_to_ojibwe("sky", "giizhig")
         translations = get_all_english_to_ojibwe()
         self.assertTrue(any(t["english_text"] == "sky" and t["ojibwe_text"] == "giizhig"
-                            for t in translations))
\ No newline at end of file
+                            for t in translations))
+
+
+def ojibwe_lib_entry(lemma: str, definition: str = "", classes: str = "main-entry-search") -> str:
+    """Build one ojibwe.lib entry, with a .definition div only when definition is given."""
+    definition_div = f'<div class="definition">{definition}</div>' if definition else ""
+    return (
+        f'<div class="{classes}"><div class="english-search-main-entry">'
+        f'<div class="main-entry-title"><span class="lemma">{lemma}</span></div>'
+        f"{lemma} entry</div>{definition_div}</div>"
+    )
+
+
+@skipIf(parsers.lxml_html is None, "lxml is not installed")
+class ParserTests(SimpleTestCase):
+    """The lxml and BeautifulSoup paths of each page parser must return the same entries."""
+
+    def parse_both(self, parser, *args):
+        """Run parser with lxml, then again with the BeautifulSoup fallback."""
+        with_lxml = parser(*args)
+        with patch.object(parsers, "lxml_html", None):
+            without_lxml = parser(*args)
+        return with_lxml, without_lxml
+
+    def test_glosbe_multi_class_items(self) -> None:
+        """Items carrying extra classes are still read by both paths."""
+        html = (
+            '<div class="translation__item extra"><span lang="oj">nibi</span> water</div>'
+            '<div class="translation__item"><span lang="oj"> </span></div>'
+            '<div class="other"><span lang="oj">ishkode</span></div>'
+        )
+        with_lxml, without_lxml = self.parse_both(parsers.parse_glosbe, html, "water")
+        self.assertEqual(with_lxml, without_lxml)
+        self.assertEqual([t["ojibwe_text"] for t in with_lxml], ["nibi"])
+        self.assertEqual(with_lxml[0]["english_text"], ["water"])
+
+    def test_ojibwe_lib_search_reads_first_result(self) -> None:
+        """Only the first entry inside a multi-class .search-results container is used."""
+        html = (
+            ojibwe_lib_entry("ishkode", "fire")
+            + '<div class="search-results wide">'
+            + ojibwe_lib_entry("makwa", "bear, a bear", classes="main-entry-search first")
+            + ojibwe_lib_entry("waabooz", "rabbit")
+            + "</div>"
+        )
+        with_lxml, without_lxml = self.parse_both(parsers.parse_ojibwe_lib_search, html, "bear")
+        self.assertEqual(with_lxml, without_lxml)
+        self.assertEqual(
+            with_lxml,
+            [{"ojibwe_text": "makwa", "english_text": ["bear"], "definition": "bear, a bear"}],
+        )
+
+    def test_ojibwe_lib_browse_scoped_to_results(self) -> None:
+        """Entries outside .search-results or without a lemma are skipped by both paths."""
+        html = (
+            ojibwe_lib_entry("ishkode", "fire")
+            + '<div class="search-results extra">'
+            + ojibwe_lib_entry("makwa", "bear, a bear")
+            + ojibwe_lib_entry("", "nothing")
+            + ojibwe_lib_entry("nibi")
+            + "</div>"
+        )
+        with_lxml, without_lxml = self.parse_both(parsers.parse_ojibwe_lib_browse, html)
+        self.assertEqual(with_lxml, without_lxml)
+        self.assertEqual([t["ojibwe_text"] for t in with_lxml], ["makwa", "nibi"])
+        self.assertEqual(with_lxml[0]["english_text"], ["bear"])
+        # Without a .definition div the English block stands in as the definition
+        self.assertEqual(with_lxml[1]["definition"], "nibi nibi entry")
+
+    def test_ojibwe_lib_browse_streaming_matches_fallback(self) -> None:
+        """Entries split across pull-parser feed slices are read like the BeautifulSoup path."""
+        html = (
+            "<html><body>" + ojibwe_lib_entry("ishkode", "fire")
+            + '<ul class="search-results">'
+            + "".join(
+                f"<li>{ojibwe_lib_entry(f'word{i}', f'gloss{i}, more' if i % 2 else '')}</li>"
+                for i in range(50)
+            )
+            + "</ul>" + ojibwe_lib_entry("waabooz", "rabbit") + "</body></html>"
+        )
+        with patch.object(parsers, "BROWSE_FEED_CHUNK", 7):
+            with_lxml, without_lxml = self.parse_both(parsers.parse_ojibwe_lib_browse, html)
+        self.assertEqual(with_lxml, without_lxml)
+        self.assertEqual(len(with_lxml), 50)
+        self.assertEqual(with_lxml[1]["english_text"], ["gloss1"])
+
+    def test_blank_pages(self) -> None:
+        """Empty and whitespace-only pages have no entries rather than raising."""
+        for html in ("", "  \n\t"):
+            with self.subTest(html=html):
+                self.assertEqual(self.parse_both(parsers.parse_glosbe, html, "water"), ([], []))
+                self.assertEqual(
+                    self.parse_both(parsers.parse_ojibwe_lib_search, html, "water"), ([], [])
+                )
+                self.assertEqual(
+                    self.parse_both(parsers.parse_ojibwe_lib_browse, html), ([], [])
+                )
+
+
+class BulkCreateTranslationsTests(TestCase):
+    """Tests for storing a scraped batch with bulk_create_translations_local."""
+
+    databases = {"default", "translations"}
+
+    def test_repeated_pairs_stored_once(self) -> None:
+        """An English-Ojibwe pair repeated across entries keeps only its first definition."""
+        stored = bulk_create_translations_local([
+            {"ojibwe_text": "Makwa", "english_text": ["Bear", "bear"], "definition": "a bear"},
+            {"ojibwe_text": "makwa", "english_text": ["bear"], "definition": "another bear"},
+        ])
+        self.assertEqual(stored, 2)
+        self.assertEqual(OjibweToEnglishLocal.objects.count(), 2)
+        rows = list(EnglishToOjibweLocal.objects.values_list("english_text", "ojibwe_text", "definition"))
+        self.assertEqual(rows, [("bear", "makwa", "A bear.")])
+
+    def test_failed_batch_stores_nothing(self) -> None:
+        """A failure in the second insert rolls back the first, so no half batch is kept."""
+        with patch.object(EnglishToOjibweLocal.objects, "bulk_create", side_effect=RuntimeError):
+            stored = bulk_create_translations_local(
+                [{"ojibwe_text": "nibi", "english_text": ["water"], "definition": ""}]
+            )
+        self.assertEqual(stored, 0)
+        self.assertFalse(OjibweToEnglishLocal.objects.exists())
+
+
+class RawDataTests(SimpleTestCase):
+    """Tests for reading, appending and validating raw scraped entries."""
+
+    def setUp(self) -> None:
+        """Give each test its own data directory."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "raw.ndjson")
+
+    def test_process_raw_data_normalizes_glosses(self) -> None:
+        """Glosses are stripped, lowercased and deduplicated in first-seen order."""
+        validated = process_raw_data([
+            {"ojibwe_text": " Makwa ", "english_text": ["Bear", " bear ", "", "Animal"], "definition": " d "},
+        ])
+        self.assertEqual(
+            validated,
+            [{"ojibwe_text": "makwa", "english_text": ["bear", "animal"], "definition": "d"}],
+        )
+
+    def test_process_raw_data_rejects_invalid_entries(self) -> None:
+        """Entries without text, with a non-list or an all-blank gloss list are dropped."""
+        validated = process_raw_data([
+            "not a dict",
+            {"ojibwe_text": "", "english_text": ["water"]},
+            {"ojibwe_text": "nibi", "english_text": "water"},
+            {"ojibwe_text": "nibi", "english_text": ["  ", ""]},
+            {"ojibwe_text": "nibi", "english_text": ["water"]},
+        ])
+        self.assertEqual([v["english_text"] for v in validated], [["water"]])
+
+    def test_append_converts_legacy_array(self) -> None:
+        """A single-array file is rewritten as NDJSON before new entries are appended."""
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump([{"ojibwe_text": "makwa", "english_text": ["bear"]}], f)
+        append_raw_data([{"ojibwe_text": "nibi", "english_text": ["water"]}], self.path)
+        with open(self.path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        self.assertEqual([json.loads(line)["ojibwe_text"] for line in lines], ["makwa", "nibi"])
+        self.assertEqual(len(list(load_raw_data(self.path))), 2)
+
+    def test_adopt_legacy_raw_data(self) -> None:
+        """Raw data under the old .json name is moved to the NDJSON path once."""
+        legacy_path = os.path.join(self.tmp.name, "raw.json")
+        with open(legacy_path, "w", encoding="utf-8") as f:
+            json.dump([{"ojibwe_text": "makwa", "english_text": ["bear"]}], f)
+        adopt_legacy_raw_data(legacy_path, self.path)
+        self.assertFalse(os.path.exists(legacy_path))
+        self.assertEqual(
+            list(load_raw_data(self.path)), [{"ojibwe_text": "makwa", "english_text": ["bear"]}]
+        )
+
+    def test_load_raw_data_skips_malformed_lines(self) -> None:
+        """A corrupt line is skipped and a missing file yields nothing."""
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write('{"ojibwe_text": "makwa"}\n{broken\n\n{"ojibwe_text": "nibi"}\n')
+        self.assertEqual([e["ojibwe_text"] for e in load_raw_data(self.path)], ["makwa", "nibi"])
+        self.assertEqual(list(load_raw_data(os.path.join(self.tmp.name, "missing.ndjson"))), [])
+
+
+class FakeResponse:
+    """Minimal stand-in for an aiohttp response used as an async context manager."""
+
+    def __init__(self, status: int, body: str = "", headers: dict = None) -> None:
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+    def raise_for_status(self) -> None:
+        pass
+
+    async def text(self) -> str:
+        return self.body
+
+
+class FakeSession:
+    """Session that returns the queued responses in order."""
+
+    def __init__(self, responses) -> None:
+        self.responses = list(responses)
+
+    def get(self, url: str) -> FakeResponse:
+        return self.responses.pop(0)
+
+
+class ScraperHelperTests(SimpleTestCase):
+    """Tests for the scraper's retry, selection and persistence helpers."""
+
+    def setUp(self) -> None:
+        """Reset module state and point the data files at a temporary directory."""
+        for state in (
+            ojibwe_scraper._host_semaphores,
+            ojibwe_scraper._host_resume_at,
+            ojibwe_scraper._stats,
+            ojibwe_scraper._seen_page_digests,
+            ojibwe_scraper._new_page_digests,
+            ojibwe_scraper._empty_searches,
+        ):
+            state.clear()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        for name, file_name in (
+            ("RAW_DATA_PATH", "raw.ndjson"),
+            ("PAGE_DIGESTS_PATH", "page_digests.bin"),
+            ("EMPTY_SEARCHES_PATH", "empty_searches.json"),
+        ):
+            patcher = patch.object(ojibwe_scraper, name, os.path.join(self.tmp.name, file_name))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_parse_retry_after(self) -> None:
+        """Seconds and HTTP dates are honored; anything else backs off exponentially."""
+        self.assertEqual(ojibwe_scraper.parse_retry_after("7", 0), 7.0)
+        self.assertEqual(ojibwe_scraper.parse_retry_after(None, 2), 4.0)
+        self.assertEqual(ojibwe_scraper.parse_retry_after("soon", 1), 2.0)
+        retry_at = time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.gmtime(time.time() + 60))
+        self.assertAlmostEqual(ojibwe_scraper.parse_retry_after(retry_at, 0), 60, delta=2)
+        self.assertEqual(ojibwe_scraper.parse_retry_after("Thu, 01 Jan 1970 00:00:00 GMT", 0), 0.0)
+
+    def test_retry_after_pauses_the_whole_host(self) -> None:
+        """A 429 sets a resume time that later requests to the same host also wait for."""
+        session = FakeSession([
+            FakeResponse(429, headers={"Retry-After": "30"}),
+            FakeResponse(200, "page"),
+            FakeResponse(200, "other page"),
+        ])
+        with patch.object(ojibwe_scraper.asyncio, "sleep", new=AsyncMock()) as sleep:
+            html = asyncio.run(ojibwe_scraper.fetch_url(session, "https://glosbe.com/en/oj/bear"))
+            self.assertEqual(html, "page")
+            self.assertAlmostEqual(sleep.await_args.args[0], 30, delta=1)
+            sleep.reset_mock()
+            asyncio.run(ojibwe_scraper.fetch_url(session, "https://glosbe.com/en/oj/water"))
+            self.assertAlmostEqual(sleep.await_args.args[0], 30, delta=1)
+        self.assertEqual(ojibwe_scraper._stats["glosbe.com"]["retry"], 1)
+
+    def test_select_words_to_scrape(self) -> None:
+        """Only the most frequent lowercase, untranslated, not recently empty words are kept."""
+        frequencies = {"water": 5, "fire": 4, "bear": 3, "moon": 2, "sun": 1, "café": 9}
+        with patch.dict(ojibwe_scraper.WORD_FREQUENCIES, frequencies, clear=True), \
+                patch.object(ojibwe_scraper, "SCRAPE_LIMIT", 2):
+            words = ojibwe_scraper.select_words_to_scrape(
+                ["Water", "water", "fire", "Bear", "moon", "sun", "a", "café"],
+                translated_english={"water"},
+                recently_empty={"fire"},
+            )
+        self.assertEqual(words, ["bear", "moon"])
+
+    def test_recently_empty_words_needs_every_host(self) -> None:
+        """A word is only skipped when every searched host recently found nothing for it."""
+        now = time.time()
+        expired = now - ojibwe_scraper.EMPTY_SEARCH_TTL - 1
+        empty_searches = {
+            "glosbe.com": {"fire": now, "moon": now, "sun": expired},
+            "example.org": {"fire": now, "sun": now},
+        }
+        self.assertEqual(
+            ojibwe_scraper.recently_empty_words(empty_searches, ["glosbe.com", "example.org"], now),
+            {"fire"},
+        )
+        self.assertEqual(ojibwe_scraper.recently_empty_words(empty_searches, [], now), set())
+
+    def test_page_digests_recorded_after_parse(self) -> None:
+        """Digests are only remembered once recorded, and persist with the raw data file."""
+        url = "https://glosbe.com/en/oj/bear"
+        digest = ojibwe_scraper.page_digest(url, "<html></html>")
+        self.assertNotEqual(digest, ojibwe_scraper.page_digest(url + "s", "<html></html>"))
+        self.assertFalse(ojibwe_scraper.is_unchanged_page(url, digest))
+        ojibwe_scraper.record_parsed_page(digest)
+        ojibwe_scraper.record_parsed_page(digest)
+        self.assertTrue(ojibwe_scraper.is_unchanged_page(url, digest))
+        self.assertEqual(ojibwe_scraper._new_page_digests, [digest])
+
+        ojibwe_scraper.save_page_digests(ojibwe_scraper._new_page_digests)
+        # Digests describe the raw data file, so they are ignored while it is missing
+        self.assertEqual(ojibwe_scraper.load_page_digests(), set())
+        open(ojibwe_scraper.RAW_DATA_PATH, "w").close()
+        self.assertEqual(ojibwe_scraper.load_page_digests(), {digest})
+
+    def test_empty_searches_round_trip(self) -> None:
+        """Saved empty searches load back, minus entries older than EMPTY_SEARCH_TTL."""
+        now = time.time()
+        ojibwe_scraper.save_empty_searches({
+            "glosbe.com": {"fire": now, "sun": now - ojibwe_scraper.EMPTY_SEARCH_TTL - 1},
+        })
+        self.assertEqual(ojibwe_scraper.load_empty_searches(), {"glosbe.com": {"fire": now}})
@@ -4,16 +4,16 @@ Perform semantic analysis on English and Ojibwe translations using sentence tran
 
 Compares definitions to find semantic matches above a threshold, storing them in SQLite.
 """
-import json
 import logging
 import os
 from typing import Dict, List, Optional
 
+import orjson
 from sentence_transformers import SentenceTransformer, util
 
 from translations.models import (
     SemanticMatchLocal,
-    create_semantic_match_local,
+    bulk_create_semantic_matches_local,
     get_all_english_to_ojibwe,
     get_all_semantic_matches_local,
     sync_to_firestore,
@@ -26,15 +26,17 @@ logger = logging.getLogger("translations.utils.analysis")
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 ENGLISH_DICT_PATH = os.path.join(BASE_DIR, "data", "english_dict.json")
 SEMANTIC_MATCHES_PATH = os.path.join(BASE_DIR, "data", "semantic_matches.json")
-PROCESSED_WORDS_PATH = os.path.join(BASE_DIR, "data", "processed_words.json")
+# One processed word per line; older runs wrote a JSON list under a .json name
+PROCESSED_WORDS_PATH = os.path.join(BASE_DIR, "data", "processed_words.txt")
+LEGACY_PROCESSED_WORDS_PATH = os.path.join(BASE_DIR, "data", "processed_words.json")
 BATCH_SIZE = 10000
 
 
 def load_english_dict() -> Dict[str, str]:
     """Load English dictionary from JSON file."""
     try:
-        with open(ENGLISH_DICT_PATH, "r", encoding="utf-8") as f:
-            english_dict = json.load(f)
+        with open(ENGLISH_DICT_PATH, "rb") as f:
+            english_dict = orjson.loads(f.read())
         logger.info(f"Loaded {len(english_dict)} entries from {ENGLISH_DICT_PATH}")
         return english_dict
     except Exception as e:
@@ -43,10 +45,27 @@ def load_english_dict() -> Dict[str, str]:
 
 
 def load_processed_words() -> List[str]:
-    """Load processed words for semantic analysis."""
+    """
+    Load processed words for semantic analysis.
+
+    The file holds one word per line. A file still under its legacy .json name,
+    either a JSON list or already line-delimited, is rewritten to the .txt name
+    in the line format so later batches can be appended to it.
+    """
     try:
-        with open(PROCESSED_WORDS_PATH, "r", encoding="utf-8") as f:
-            processed = json.load(f)
+        if not os.path.exists(PROCESSED_WORDS_PATH) and os.path.exists(LEGACY_PROCESSED_WORDS_PATH):
+            with open(LEGACY_PROCESSED_WORDS_PATH, "r", encoding="utf-8") as f:
+                content = f.read()
+            if content.lstrip().startswith("["):
+                processed = orjson.loads(content)
+            else:
+                processed = [line for line in content.splitlines() if line]
+            with open(PROCESSED_WORDS_PATH, "w", encoding="utf-8") as f:
+                f.writelines(f"{word}\n" for word in processed)
+            os.remove(LEGACY_PROCESSED_WORDS_PATH)
+        else:
+            with open(PROCESSED_WORDS_PATH, "r", encoding="utf-8") as f:
+                processed = [line for line in f.read().splitlines() if line]
         logger.info(f"Loaded {len(processed)} processed words from {PROCESSED_WORDS_PATH}")
         return processed
     except FileNotFoundError:
@@ -57,21 +76,23 @@ def load_processed_words() -> List[str]:
         return []
 
 
-def save_processed_words(processed_words: List[str]) -> None:
-    """Save processed words to JSON file."""
+def append_processed_words(words: List[str]) -> None:
+    """Append a batch of newly processed words to the processed words file."""
     try:
-        with open(PROCESSED_WORDS_PATH, "w", encoding="utf-8") as f:
-            json.dump(processed_words, f)
-        logger.info(f"Saved {len(processed_words)} processed words to {PROCESSED_WORDS_PATH}")
+        with open(PROCESSED_WORDS_PATH, "a", encoding="utf-8") as f:
+            f.writelines(f"{word}\n" for word in words)
+        logger.info(f"Appended {len(words)} processed words to {PROCESSED_WORDS_PATH}")
     except Exception as e:
         logger.error(f"Error saving processed words: {e}")
 
 
 def save_semantic_matches(matches: List[Dict]) -> None:
-    """Save semantic matches to JSON for frontend access."""
+    """Save semantic matches to JSON for frontend access, replacing the file atomically."""
     try:
-        with open(SEMANTIC_MATCHES_PATH, "w", encoding="utf-8") as f:
-            json.dump(matches, f, indent=2)
+        tmp_path = f"{SEMANTIC_MATCHES_PATH}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(matches, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, SEMANTIC_MATCHES_PATH)
         logger.info(f"Saved {len(matches)} matches to {SEMANTIC_MATCHES_PATH}")
     except Exception as e:
         logger.error(f"Error saving semantic matches: {e}")
@@ -142,9 +163,10 @@ def print_semantic_matches(threshold: float = 0.7, version: str = "1.0") -> Opti
     logger.info(f"Found {len(untranslated_english)} untranslated English words.")
 
     from translations.utils.frequencies import WORD_FREQUENCIES
-    word_freqs = [(word, WORD_FREQUENCIES.get(word.lower(), 0)) for word in untranslated_english]
-    word_freqs.sort(key=lambda x: x[1], reverse=True)
-    untranslated_english_sorted = [word for word, _ in word_freqs]
+    # Words and frequency keys are both lowercase, so no per-word normalization is needed
+    untranslated_english_sorted = sorted(
+        untranslated_english, key=lambda word: WORD_FREQUENCIES.get(word, 0), reverse=True
+    )
 
     processed_words = set(load_processed_words())
     remaining_words = [word for word in untranslated_english_sorted if word not in processed_words]
@@ -164,13 +186,11 @@ def print_semantic_matches(threshold: float = 0.7, version: str = "1.0") -> Opti
         return None
 
     matches = []
-    batch_index = 0
     total_processed = len(processed_words)
 
-    while remaining_words:
-        batch_words = remaining_words[:BATCH_SIZE]
-        remaining_words = remaining_words[BATCH_SIZE:]
-        batch_index += 1
+    # Walk the word list by offset rather than re-slicing the remainder on every batch
+    for batch_index, start in enumerate(range(0, len(remaining_words), BATCH_SIZE), start=1):
+        batch_words = remaining_words[start:start + BATCH_SIZE]
 
         logger.info(f"Processing batch {batch_index} with {len(batch_words)} words (Total: {total_processed})")
 
@@ -179,7 +199,7 @@ def print_semantic_matches(threshold: float = 0.7, version: str = "1.0") -> Opti
             logger.warning(f"No valid definitions for batch {batch_index}. Skipping.")
             processed_words.update(batch_words)
             total_processed += len(batch_words)
-            save_processed_words(list(processed_words))
+            append_processed_words(batch_words)
             continue
 
         try:
@@ -189,7 +209,7 @@ def print_semantic_matches(threshold: float = 0.7, version: str = "1.0") -> Opti
             logger.error(f"Error computing English embeddings for batch {batch_index}: {e}")
             processed_words.update(batch_words)
             total_processed += len(batch_words)
-            save_processed_words(list(processed_words))
+            append_processed_words(batch_words)
             continue
 
         try:
@@ -199,7 +219,7 @@ def print_semantic_matches(threshold: float = 0.7, version: str = "1.0") -> Opti
             logger.error(f"Error computing cosine similarities for batch {batch_index}: {e}")
             processed_words.update(batch_words)
             total_processed += len(batch_words)
-            save_processed_words(list(processed_words))
+            append_processed_words(batch_words)
             continue
 
         batch_matches = []
@@ -220,23 +240,11 @@ def print_semantic_matches(threshold: float = 0.7, version: str = "1.0") -> Opti
         logger.info(f"Batch {batch_index} generated {len(batch_matches)} matches")
         matches.extend(batch_matches)
 
-        for match in batch_matches:
-            try:
-                create_semantic_match_local(
-                    english_text=match["english_text"],
-                    ojibwe_text=match["ojibwe_text"],
-                    similarity=match["similarity"],
-                    english_definition=match["english_definition"],
-                    ojibwe_definition=match["ojibwe_definition"],
-                    version=version,
-                )
-            except Exception as e:
-                logger.error(f"Error storing match {match['english_text']} => {match['ojibwe_text']}: {e}")
-
-        logger.info(f"Stored {len(batch_matches)} matches in SQLite for version {version}")
+        stored = bulk_create_semantic_matches_local(batch_matches, version=version)
+        logger.info(f"Stored {stored} matches in SQLite for version {version}")
         processed_words.update(batch_words)
         total_processed += len(batch_words)
-        save_processed_words(list(processed_words))
+        append_processed_words(batch_words)
 
     logger.info(f"Generated and stored {len(matches)} matches with threshold {threshold}")
     save_semantic_matches(matches)
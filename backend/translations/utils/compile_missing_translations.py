@@ -13,8 +13,8 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "vota_backend.settings")
 import django
 django.setup()
 
-from translations.models import get_all_ojibwe_to_english
-from translations.utils.frequencies import WORD_FREQUENCIES
+from translations.models import get_translated_english_words
+from translations.utils.frequencies import get_top_words
 
 
 def compile_missing_translations(output_path: str, top_n: int = 1000) -> None:
@@ -24,17 +24,15 @@ def compile_missing_translations(output_path: str, top_n: int = 1000) -> None:
         output_path (str): Path to save the list of missing translations.
         top_n (int): Number of top common words to consider. Defaults to 1000.
     """
-    # Get all Ojibwe-to-English translations from MongoDB
-    ojibwe_translations = get_all_ojibwe_to_english()
-    translated_english = {t["english_text"][0].lower() for t in ojibwe_translations if t.get("english_text")}
+    # Get the set of English words that already have a translation
+    translated_english = get_translated_english_words()
 
     # Get the top N most common English words
-    sorted_words = sorted(WORD_FREQUENCIES.items(), key=lambda x: x[1], reverse=True)[:top_n]
-    common_words = {word.lower() for word, _ in sorted_words}
+    # (already in descending frequency order, so no re-sort is needed)
+    sorted_words = get_top_words(top_n)
 
     # Identify missing translations
-    missing_words = common_words - translated_english
-    missing_words = sorted(missing_words, key=lambda x: WORD_FREQUENCIES.get(x, 0), reverse=True)
+    missing_words = [word for word, _ in sorted_words if word not in translated_english]
 
     # Save the list to a JSON file
     with open(output_path, "w", encoding="utf-8") as f:
@@ -22,9 +22,11 @@ def populate_english_dict(json_path: str, db_path: str = "translations.db") -> N
         """
     )
 
-    # Insert words, avoiding duplicates
-    for word in english_dict:
-        cursor.execute("INSERT OR IGNORE INTO english_dict (word) VALUES (?)", (word,))
+    # Insert words in a single executemany, avoiding duplicates
+    cursor.executemany(
+        "INSERT OR IGNORE INTO english_dict (word) VALUES (?)",
+        ((word,) for word in english_dict),
+    )
 
     conn.commit()
     conn.close()
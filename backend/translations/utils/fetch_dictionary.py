@@ -3,7 +3,8 @@ import requests
 import sqlite3
 import json
 import os
-from typing import Set, Dict, Any
+from email.utils import formatdate
+from typing import Dict, Any, Optional
 
 
 DICTIONARY_URL = "https://raw.githubusercontent.com/matthewreagan/WebstersEnglishDictionary/master/dictionary.json"
@@ -13,56 +14,63 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__fil
 JSON_PATH = os.path.join(BASE_DIR, "data", "english_dict.json")
 
 
-def fetch_dictionary() -> Dict[str, Any]:
-    """Fetch the English dictionary from a remote JSON source."""
-    response = requests.get(DICTIONARY_URL, timeout=10)
+def fetch_dictionary(modified_since: Optional[float] = None) -> Optional[Dict[str, Any]]:
+    """Fetch the English dictionary from a remote JSON source.
+
+    When modified_since (the cached copy's modification time) is given, the request
+    is conditional and None is returned if the dictionary has not changed upstream.
+    """
+    headers = {}
+    if modified_since is not None:
+        headers["If-Modified-Since"] = formatdate(modified_since, usegmt=True)
+    response = requests.get(DICTIONARY_URL, headers=headers, timeout=10)
+    if response.status_code == 304:
+        return None
     response.raise_for_status()
     return response.json()
 
 
-def get_existing_words(db_path: str = "translations.db") -> Set[str]:
-    """Retrieve all existing words from the SQLite english_dict table."""
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute("CREATE TABLE IF NOT EXISTS english_dict (word TEXT PRIMARY KEY)")
-    conn.commit()
-    cursor.execute("SELECT word FROM english_dict")
-    existing_words = {row[0] for row in cursor.fetchall()}
-    conn.close()
-    return existing_words
-
-
 def update_dictionary(db_path: str = "translations.db", json_path: str = JSON_PATH) -> int:
     """Fetch the latest dictionary, update SQLite, and save to JSON."""
     try:
-        dictionary_data = fetch_dictionary()
-        new_words = set(dictionary_data.keys())
-
-        # Ensure the data directory exists
-        os.makedirs(os.path.dirname(json_path), exist_ok=True)
-
-        # Save to JSON
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(dictionary_data, f)
-        print(f"Saved dictionary to {json_path}")
-
-        # Update SQLite (adjust db_path if needed)
+        modified_since = os.path.getmtime(json_path) if os.path.exists(json_path) else None
+        dictionary_data = fetch_dictionary(modified_since)
+        if dictionary_data is None:
+            # Unchanged upstream (304): reuse the saved copy instead of re-downloading it
+            with open(json_path, "r", encoding="utf-8") as f:
+                dictionary_data = json.load(f)
+            os.utime(json_path)
+            print(f"Dictionary unchanged upstream. Using {json_path}")
+        else:
+            # Ensure the data directory exists
+            os.makedirs(os.path.dirname(json_path), exist_ok=True)
+
+            # Save to JSON
+            with open(json_path, "w", encoding="utf-8") as f:
+                json.dump(dictionary_data, f)
+            print(f"Saved dictionary to {json_path}")
+
+        # Update SQLite (adjust db_path if needed). The primary key lets SQLite skip
+        # existing words itself, so the table is never read back into Python.
         db_full_path = os.path.join(BASE_DIR, db_path)
-        existing_words = get_existing_words(db_full_path)
-        words_to_add = new_words - existing_words
-        if not words_to_add:
-            print("No new words to add to SQLite.")
-            return 0
-
         conn = sqlite3.connect(db_full_path)
         cursor = conn.cursor()
-        for word in words_to_add:
-            cursor.execute("INSERT OR IGNORE INTO english_dict (word) VALUES (?)", (word,))
+        cursor.execute("CREATE TABLE IF NOT EXISTS english_dict (word TEXT PRIMARY KEY)")
+        changes_before = conn.total_changes
+        # One executemany in one transaction instead of a statement per word
+        cursor.executemany(
+            "INSERT OR IGNORE INTO english_dict (word) VALUES (?)",
+            ((word,) for word in dictionary_data),
+        )
         conn.commit()
+        added = conn.total_changes - changes_before
         conn.close()
+        if not added:
+            print("No new words to add to SQLite.")
+            return 0
 
-        print(f"Added {len(words_to_add)} new words to SQLite.")
-        return len(words_to_add)
+        print(f"Added {added} new words to SQLite.")
+        return added
     except requests.RequestException as e:
         print(f"Failed to fetch dictionary: {e}")
         return 0
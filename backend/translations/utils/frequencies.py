@@ -1,10 +1,17 @@
 """Shared word frequency data for ranking English words by usage."""
+import functools
+import heapq
+import logging
+import operator
 import os
-import json
 import time
-from typing import Dict
+from email.utils import formatdate
+from typing import Dict, Optional, Tuple
+import orjson
 import requests
 
+logger = logging.getLogger("translations.utils.frequencies")
+
 # Base directory (three levels up from frequencies.py to backend/)
 BASE_DIR = os.path.dirname(
     os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -21,17 +28,28 @@ FREQUENCY_URL = "https://raw.githubusercontent.com/dwyl/english-words/master/wor
 UPDATE_THRESHOLD_SECONDS = 7 * 24 * 60 * 60  # 7 days in seconds
 
 
-def fetch_word_frequencies() -> Dict[str, int]:
+def fetch_word_frequencies(modified_since: Optional[float] = None) -> Optional[Dict[str, int]]:
     """Fetch word frequencies from a public source.
 
     For demonstration, this uses a simple word list and assigns frequencies.
     In practice, use a real frequency list like norvig.com/ngrams/count_1w.txt.
 
+    Args:
+        modified_since (Optional[float]): Modification time of the cached copy. When
+            given, the request is conditional and the list is only downloaded if it
+            changed upstream.
+
     Returns:
-        Dict[str, int]: Dictionary mapping words to their frequencies.
+        Optional[Dict[str, int]]: Dictionary mapping words to their frequencies, or
+        None if the server reports the cached copy is still current.
     """
+    headers = {}
+    if modified_since is not None:
+        headers["If-Modified-Since"] = formatdate(modified_since, usegmt=True)
     try:
-        response = requests.get(FREQUENCY_URL, timeout=10)
+        response = requests.get(FREQUENCY_URL, headers=headers, timeout=10)
+        if response.status_code == 304:
+            return None
         response.raise_for_status()
         words = response.text.splitlines()
         # Assign decreasing frequencies (simplified for demo)
@@ -41,7 +59,7 @@ def fetch_word_frequencies() -> Dict[str, int]:
             freqs[word.lower()] = 1000000 - i  # Decreasing frequency
         return freqs
     except requests.RequestException as e:
-        print(f"Error fetching word frequencies: {e}")
+        logger.error(f"Error fetching word frequencies: {e}")
         return {}
 
 
@@ -56,37 +74,64 @@ def load_word_frequencies() -> Dict[str, int]:
     """
     # Check if the file exists and its age
     should_update = False
+    modified_since = None
     if not os.path.exists(FREQUENCY_PATH):
-        print(f"Word frequency file not found at {FREQUENCY_PATH}. Creating new file.")
+        logger.info(f"Word frequency file not found at {FREQUENCY_PATH}. Creating new file.")
         should_update = True
     else:
-        file_age = time.time() - os.path.getmtime(FREQUENCY_PATH)
+        modified_since = os.path.getmtime(FREQUENCY_PATH)
+        file_age = time.time() - modified_since
         if file_age > UPDATE_THRESHOLD_SECONDS:
-            print(f"Word frequency file is outdated (age: {file_age} seconds). Updating.")
+            logger.info(f"Word frequency file is outdated (age: {file_age} seconds). Updating.")
             should_update = True
 
     if should_update:
-        freqs = fetch_word_frequencies()
-        if freqs:
-            with open(FREQUENCY_PATH, "w", encoding="utf-8") as f:
-                json.dump(freqs, f)
-            print(f"Saved updated frequencies to {FREQUENCY_PATH}")
+        freqs = fetch_word_frequencies(modified_since)
+        if freqs is None:
+            # Unchanged upstream (304): restart the age clock and keep the cached copy
+            os.utime(FREQUENCY_PATH)
+            logger.info("Word frequency list unchanged upstream. Keeping cached file.")
+            should_update = False
+        elif freqs:
+            with open(FREQUENCY_PATH, "wb") as f:
+                f.write(orjson.dumps(freqs))
+            logger.info(f"Saved updated frequencies to {FREQUENCY_PATH}")
+        elif modified_since is not None:
+            logger.warning("Failed to fetch frequencies. Using the outdated cached file.")
+            should_update = False
         else:
-            print("Failed to fetch frequencies. Using empty dictionary.")
+            logger.warning("Failed to fetch frequencies. Using empty dictionary.")
             freqs = {}
-    else:
+    if not should_update:
         try:
-            with open(FREQUENCY_PATH, "r", encoding="utf-8") as f:
-                freqs = json.load(f)
-            print(f"Loaded frequencies from {FREQUENCY_PATH}")
+            with open(FREQUENCY_PATH, "rb") as f:
+                freqs = orjson.loads(f.read())
+            logger.info(f"Loaded frequencies from {FREQUENCY_PATH}")
         except Exception as e:
-            print(f"Error loading frequencies: {e}. Fetching new list.")
-            freqs = fetch_word_frequencies()
+            logger.error(f"Error loading frequencies: {e}. Fetching new list.")
+            freqs = fetch_word_frequencies() or {}
             if freqs:
-                with open(FREQUENCY_PATH, "w", encoding="utf-8") as f:
-                    json.dump(freqs, f)
+                with open(FREQUENCY_PATH, "wb") as f:
+                    f.write(orjson.dumps(freqs))
+
+    # Normalize keys once so lookups only ever need to lowercase the query word
+    return {word.lower(): freq for word, freq in freqs.items()}
+
 
-    return freqs
+@functools.lru_cache(maxsize=None)
+def get_top_words(top_n: int) -> Tuple[Tuple[str, int], ...]:
+    """Return the top_n most frequent (word, frequency) pairs, highest first.
+
+    Uses a bounded heap (O(N log top_n)) instead of sorting every word, and
+    caches the result since WORD_FREQUENCIES does not change after import.
+
+    Args:
+        top_n (int): Number of words to return.
+
+    Returns:
+        Tuple[Tuple[str, int], ...]: (word, frequency) pairs in descending order.
+    """
+    return tuple(heapq.nlargest(top_n, WORD_FREQUENCIES.items(), key=operator.itemgetter(1)))
 
 
 # Load frequencies at module level
@@ -1,7 +1,11 @@
 """Module to dynamically determine the number of words in the English dictionary database."""
+import logging
 import sqlite3
 from typing import Optional
 
+logger = logging.getLogger("translations.utils.get_dict_size")
+
+
 def get_english_dict_size(db_path: str = "translations.db") -> int:
     """Retrieve the number of words in the English dictionary SQLite table.
     Args:
@@ -19,5 +23,5 @@ def get_english_dict_size(db_path: str = "translations.db") -> int:
         conn.close()
         return count
     except sqlite3.Error as e:
-        print(f"Error fetching dictionary size: {e}")
+        logger.error(f"Error fetching dictionary size: {e}")
         return 0
@@ -1,33 +1,103 @@
 # backend/translations/utils/process_raw_data.py
 """
 Utilities for processing raw scraped data into validated translation entries.
+
+Raw data is stored as newline-delimited JSON (one entry per line, ``.ndjson``),
+not as a single JSON document, so it cannot be read with a plain ``json.load``.
 """
-import json
+import itertools
 import os
-from typing import Dict, List, Union
+from typing import Dict, Iterable, Iterator, List, Union
+
+import orjson
 
 import logging
 logger = logging.getLogger(__name__)
 
-def load_raw_data(file_path: str) -> List[Dict[str, Union[str, List[str]]]]:
-    """Load raw translation data from a JSON file."""
+def _is_json_array_file(file_path: str) -> bool:
+    """Return True if file_path holds raw data in the legacy single-JSON-array format."""
+    try:
+        with open(file_path, "rb") as f:
+            return f.read(64).lstrip()[:1] == b"["
+    except FileNotFoundError:
+        return False
+
+def load_raw_data(file_path: str) -> Iterator[Dict[str, Union[str, List[str]]]]:
+    """
+    Stream raw translation entries from disk one at a time.
+
+    Raw data is stored as newline-delimited JSON (one entry per line), so only a
+    single entry is held in memory at once. Files in the legacy format (a single
+    JSON array) are still accepted and are rewritten as NDJSON on the next save.
+    """
+    legacy_format = _is_json_array_file(file_path)
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        if not isinstance(data, list):
-            logger.error(f"Raw data in {file_path} is not a list.")
-            return []
-        return data
-    except (FileNotFoundError, json.JSONDecodeError) as e:
+        with open(file_path, "rb") as f:
+            if legacy_format:
+                yield from orjson.loads(f.read())
+                return
+            for line_number, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield orjson.loads(line)
+                except orjson.JSONDecodeError as e:
+                    logger.warning(f"Skipping malformed line {line_number} in {file_path}: {e}")
+    except FileNotFoundError:
+        logger.warning(f"No raw data found at {file_path}. Starting fresh.")
+    except orjson.JSONDecodeError as e:
         logger.warning(f"Failed to load raw data from {file_path}: {e}. Starting fresh.")
-        return []
 
-def save_raw_data(data: List[Dict[str, Union[str, List[str]]]], file_path: str) -> None:
-    """Save raw translation data to a JSON file."""
+def save_raw_data(data: Iterable[Dict[str, Union[str, List[str]]]], file_path: str) -> None:
+    """
+    Save raw translation data to disk as newline-delimited JSON.
+
+    Entries are streamed to a temporary file that atomically replaces the target,
+    so ``data`` may lazily read from ``file_path`` itself (e.g. via
+    ``itertools.chain(load_raw_data(file_path), new_entries)``).
+    """
     os.makedirs(os.path.dirname(file_path), exist_ok=True)
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-    logger.info(f"Saved {len(data)} raw entries to {file_path}.")
+    tmp_path = f"{file_path}.tmp"
+    count = 0
+    with open(tmp_path, "wb") as f:
+        for entry in data:
+            f.write(orjson.dumps(entry))
+            f.write(b"\n")
+            count += 1
+    os.replace(tmp_path, file_path)
+    logger.info(f"Saved {count} raw entries to {file_path}.")
+
+def append_raw_data(data: Iterable[Dict[str, Union[str, List[str]]]], file_path: str) -> None:
+    """
+    Append raw translation entries to the NDJSON file without rewriting it.
+
+    Only the new entries are written, so the cost is independent of the size of the
+    existing corpus. A legacy single-array file is converted with a full rewrite first.
+    """
+    if _is_json_array_file(file_path):
+        save_raw_data(itertools.chain(load_raw_data(file_path), data), file_path)
+        return
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    count = 0
+    with open(file_path, "ab") as f:
+        for entry in data:
+            f.write(orjson.dumps(entry))
+            f.write(b"\n")
+            count += 1
+    logger.info(f"Appended {count} raw entries to {file_path}.")
+
+def adopt_legacy_raw_data(legacy_path: str, file_path: str) -> None:
+    """
+    Move raw data from its legacy ``.json`` name to file_path as NDJSON.
+
+    Nothing is done once file_path exists or when there is no legacy file.
+    """
+    if os.path.exists(file_path) or not os.path.exists(legacy_path):
+        return
+    save_raw_data(load_raw_data(legacy_path), file_path)
+    os.remove(legacy_path)
+    logger.info(f"Converted legacy raw data {legacy_path} to {file_path}.")
 
 def check_for_duplicates(raw_data: List[Dict[str, Union[str, List[str]]]]) -> List[Dict[str, Union[str, List[str]]]]:
     """
@@ -43,27 +113,49 @@ def check_for_duplicates(raw_data: List[Dict[str, Union[str, List[str]]]]) -> Li
             seen.add(key)
             unique_entries.append(entry)
         else:
-            logger.warning(f"Duplicate entry found and removed: {entry}")
+            logger.debug("Duplicate entry found and removed: %s", entry)
     logger.info(f"Removed {len(raw_data) - len(unique_entries)} duplicates.")
     return unique_entries
 
-def process_raw_data(raw_data: List[Dict[str, Union[str, List[str]]]]) -> List[Dict[str, Union[str, List[str]]]]:
-    """Process raw data into validated translation entries."""
+def process_raw_data(raw_data: Iterable[Dict[str, Union[str, List[str]]]]) -> List[Dict[str, Union[str, List[str]]]]:
+    """
+    Process raw data into validated translation entries, consuming it lazily.
+
+    Ojibwe and English texts are lowercased here, once per entry, to match how
+    translations are stored, so later dedup and validation steps can compare
+    them directly.
+    """
     validated = []
+    total = 0
+    # Raw data is append-only and re-read on every run, so invalid entries are
+    # summarized once and only itemized at debug level
+    invalid = 0
     for entry in raw_data:
+        total += 1
         if not isinstance(entry, dict):
-            logger.warning(f"Invalid entry format: {entry}")
+            invalid += 1
+            logger.debug("Invalid entry format: %s", entry)
             continue
         ojibwe_text = entry.get("ojibwe_text", "").strip()
         english_text = entry.get("english_text", [])
         definition = entry.get("definition", "").strip()
         if not ojibwe_text or not english_text or not isinstance(english_text, list):
-            logger.warning(f"Missing or invalid fields in entry: {entry}")
+            invalid += 1
+            logger.debug("Missing or invalid fields in entry: %s", entry)
+            continue
+        # Each gloss is normalized once and repeats are dropped, keeping first-seen order
+        glosses = dict.fromkeys(e.strip().lower() for e in english_text)
+        glosses.pop("", None)
+        if not glosses:
+            invalid += 1
+            logger.debug("No non-blank English gloss in entry: %s", entry)
             continue
         validated.append({
-            "ojibwe_text": ojibwe_text,
-            "english_text": [e.strip() for e in english_text if e.strip()],
+            "ojibwe_text": ojibwe_text.lower(),
+            "english_text": list(glosses),
             "definition": definition,
         })
-    logger.info(f"Processed {len(validated)} validated entries from {len(raw_data)} raw entries.")
+    if invalid:
+        logger.warning(f"Skipped {invalid} invalid raw entries.")
+    logger.info(f"Processed {len(validated)} validated entries from {total} raw entries.")
     return validated